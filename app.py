@@ -10,23 +10,89 @@ Usage:
     python app.py                    # Start development server
     python app.py --port 8080        # Start on custom port
     python app.py --production       # Start in production mode
+    python app.py --workers 8        # Tune worker processes/threads
 """
 
 import os
 import sys
-import argparse
 import logging
-from dotenv import load_dotenv
+from functools import lru_cache
+from types import SimpleNamespace
 
-# Load environment variables
-load_dotenv()
+# Snapshot of the process environment, refreshed once .env is loaded
+_ENV = dict(os.environ)
+_DOTENV_MTIME = None
 
-# Add the app directory to the Python path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
+# Log level names accepted on the command line
+_LOG_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+}
+_LOG_LEVEL_CHOICES = tuple(_LOG_LEVELS)
+
+_DEFAULT_PORT = 8000
+
+# Requests mostly wait on AI providers and paper sources, so each gunicorn
+# worker serves several of them at once on threads
+_THREADS_PER_WORKER = 8
+
+# Environment variables checked at startup
+_REQUIRED_ENV_VARS = frozenset()
+_AI_SERVICE_KEYS = frozenset({'OPENAI_API_KEY', 'DEEPSEEK_API_KEY', 'PERPLEXITY_API_KEY'})
+
+
+def load_environment(production=False):
+    """
+    Load variables from .env and refresh the environment snapshot.
+    
+    The file is only re-parsed when its modification time changes. In
+    production the environment is expected to be provided by the process
+    manager, so .env is skipped entirely.
+    """
+    global _DOTENV_MTIME
+    
+    if production:
+        return
+    
+    from dotenv import find_dotenv, load_dotenv
+    
+    dotenv_path = find_dotenv()
+    if not dotenv_path:
+        return
+    
+    mtime = os.stat(dotenv_path).st_mtime
+    if mtime == _DOTENV_MTIME:
+        return
+    
+    load_dotenv(dotenv_path, override=False)
+    _DOTENV_MTIME = mtime
+    _ENV.clear()
+    _ENV.update(os.environ)
+
+
+def _env(key, default=None):
+    """Read a variable from the startup environment snapshot."""
+    return _ENV.get(key, default)
 
 
 def parse_arguments():
     """Parse command line arguments."""
+    # Plain `python app.py` needs no parser; only build one when flags are given
+    if len(sys.argv) == 1:
+        return SimpleNamespace(
+            port=None,
+            host='0.0.0.0',
+            production=False,
+            debug=False,
+            log_level='INFO',
+            workers=None
+        )
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='MetaFunction - AI-Powered Scientific Paper Analysis Platform'
     )
@@ -34,8 +100,8 @@ def parse_arguments():
     parser.add_argument(
         '--port', '-p',
         type=int,
-        default=int(os.getenv('PORT', 8000)),
-        help='Port to run the server on (default: 8000)'
+        default=None,
+        help=f'Port to run the server on (default: $PORT or {_DEFAULT_PORT})'
     )
     
     parser.add_argument(
@@ -58,29 +124,42 @@ def parse_arguments():
     
     parser.add_argument(
         '--log-level',
-        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+        choices=_LOG_LEVEL_CHOICES,
         default='INFO',
         help='Set the logging level (default: INFO)'
     )
     
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=None,
+        help='Worker processes (production) or threads (waitress) to use'
+    )
+    
     return parser.parse_args()
 
 
 def setup_ssl_context():
     """Setup SSL context for secure connections."""
-    import ssl
+    # Outbound AI calls are the only startup consumers of the SSL setup
+    if not any(_env(var) for var in _AI_SERVICE_KEYS):
+        return
+    
     import certifi
+    import urllib.request
     
-    # Create unverified SSL context for development/testing
-    ssl._create_default_https_context = ssl._create_unverified_context
+    # Use certifi certificates unless the user already points elsewhere
+    os.environ.setdefault('SSL_CERT_FILE', certifi.where())
     
-    # Use certifi certificates
-    os.environ['SSL_CERT_FILE'] = certifi.where()
+    # Route urllib-based clients (e.g. Bio.Entrez) through one shared,
+    # verified context instead of disabling certificate checks globally
+    from app.utils.http import get_ssl_context
+    https_handler = urllib.request.HTTPSHandler(context=get_ssl_context())
+    urllib.request.install_opener(urllib.request.build_opener(https_handler))
 
 
 def validate_environment():
     """Validate that required environment variables are set."""
-    required_vars = []
     optional_vars = [
         'OPENAI_API_KEY',
         'DEEPSEEK_API_KEY', 
@@ -89,32 +168,99 @@ def validate_environment():
         'DEEPSEEK_PASSWORD'
     ]
     
-    missing_vars = []
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
+    # Single pass over the snapshot for every variable we care about
+    configured = {
+        var for var in _REQUIRED_ENV_VARS | _AI_SERVICE_KEYS if _ENV.get(var)
+    }
+    missing_vars = sorted(_REQUIRED_ENV_VARS - configured)
     
     if missing_vars:
         logging.error(f"Missing required environment variables: {', '.join(missing_vars)}")
         sys.exit(1)
     
     # Check if at least one AI service is configured
-    ai_services = ['OPENAI_API_KEY', 'DEEPSEEK_API_KEY', 'PERPLEXITY_API_KEY']
-    if not any(os.getenv(var) for var in ai_services):
+    if configured.isdisjoint(_AI_SERVICE_KEYS):
         logging.warning("No AI service API keys found. Some features may not work.")
     
     logging.info("Environment validation completed")
 
 
+@lru_cache(maxsize=1)
+def get_app():
+    """Create the Flask application once per process and reuse it."""
+    from app.main import create_app
+    return create_app()
+
+
+def exec_production_server(args):
+    """
+    Replace the current process with a gunicorn server.
+    
+    Gunicorn is started with --preload so the application is created once
+    in the master and shared with the forked workers. Workers use the
+    gthread class, so a slow upstream call does not block the whole worker.
+    Returns only if gunicorn is not installed.
+    """
+    import shutil
+    
+    gunicorn = shutil.which('gunicorn')
+    if not gunicorn:
+        logging.warning("gunicorn not found, falling back to the Flask server")
+        return
+    
+    os.execv(gunicorn, [
+        'gunicorn',
+        '--preload',
+        '--workers', str(args.workers or os.cpu_count() or 1),
+        '--worker-class', 'gthread',
+        '--threads', str(_THREADS_PER_WORKER),
+        '--bind', f'{args.host}:{args.port}',
+        '--log-level', args.log_level.lower(),
+        'app.main:create_app()'
+    ])
+
+
+def serve_app(app, args, debug_mode):
+    """
+    Serve the application in the foreground.
+    
+    Debug runs keep the Werkzeug dev server for its reloader and debugger;
+    other runs use waitress' thread pool when it is installed.
+    """
+    if not debug_mode:
+        try:
+            from waitress import serve
+        except ImportError:
+            logging.warning("waitress not found, falling back to the Flask server")
+        else:
+            serve(app, host=args.host, port=args.port, threads=args.workers or 4)
+            return
+    
+    app.run(
+        host=args.host,
+        port=args.port,
+        debug=debug_mode,
+        threaded=True
+    )
+
+
 def main():
     """Main entry point for the application."""
     args = parse_arguments()
     
+    # Load environment variables only once the command line is known to be valid
+    load_environment(production=args.production)
+    if args.port is None:
+        args.port = int(_env('PORT', _DEFAULT_PORT))
+    
     # Configure logging
-    log_level = getattr(logging, args.log_level.upper())
+    # force=True replaces existing handlers, so re-entering main() (tests,
+    # the reloader) does not stack duplicate handlers
+    log_level = _LOG_LEVELS[args.log_level]
     logging.basicConfig(
         level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        force=True
     )
     
     logger = logging.getLogger(__name__)
@@ -126,39 +272,42 @@ def main():
     # Validate environment
     validate_environment()
     
+    # Production runs are served by gunicorn rather than the dev server
+    if args.production and not args.debug:
+        exec_production_server(args)
+    
     # Import and create the Flask app using the application factory
     try:
-        from app.main import create_app
-        app = create_app()
+        app = get_app()
     except ImportError as e:
         logger.error(f"Failed to import application factory: {e}")
         logger.error("Make sure you're in the correct directory and dependencies are installed")
         sys.exit(1)
     
     # Determine if we're running in debug mode
-    debug_mode = args.debug or (not args.production and os.getenv('FLASK_ENV') == 'development')
+    debug_mode = args.debug or (not args.production and _env('FLASK_ENV') == 'development')
     
-    logger.info(f"Starting server on {args.host}:{args.port}")
-    logger.info(f"Debug mode: {debug_mode}")
-    logger.info(f"Environment: {'development' if debug_mode else 'production'}")
+    logger.info("Starting server on %s:%d", args.host, args.port)
+    logger.info("Debug mode: %s", debug_mode)
+    logger.info("Environment: %s", 'development' if debug_mode else 'production')
     
-    # Print startup banner
-    print("\n" + "="*60)
-    print("🧬 MetaFunction - AI-Powered Scientific Paper Analysis")
-    print("="*60)
-    print(f"🌐 Server: http://{args.host}:{args.port}")
-    print(f"🔧 Mode: {'Development' if debug_mode else 'Production'}")
-    print(f"📊 Log Level: {args.log_level}")
-    print("="*60 + "\n")
+    # Print startup banner in a single write; skip it when output is piped
+    # to a log collector (docker, systemd)
+    if sys.stdout.isatty():
+        rule = "=" * 60
+        sys.stdout.write(
+            f"\n{rule}\n"
+            "🧬 MetaFunction - AI-Powered Scientific Paper Analysis\n"
+            f"{rule}\n"
+            f"🌐 Server: http://{args.host}:{args.port}\n"
+            f"🔧 Mode: {'Development' if debug_mode else 'Production'}\n"
+            f"📊 Log Level: {args.log_level}\n"
+            f"{rule}\n\n"
+        )
+        sys.stdout.flush()
     
     try:
-        # Start the Flask development server
-        app.run(
-            host=args.host,
-            port=args.port,
-            debug=debug_mode,
-            threaded=True
-        )
+        serve_app(app, args, debug_mode)
     except KeyboardInterrupt:
         logger.info("Application stopped by user")
     except Exception as e:
@@ -5,14 +5,24 @@ Base client interface for AI providers.
 import os
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterator, Optional
+
+from app.utils import serialization
 
 logger = logging.getLogger(__name__)
 
 
+def is_transient_status(status_code: int) -> bool:
+    """Return True for HTTP statuses worth retrying (rate limits, server errors)."""
+    return status_code == 429 or status_code >= 500
+
+
 class BaseAIClient(ABC):
     """Abstract base class for AI clients."""
     
+    # Whether get_response already retries transient errors itself
+    retries_transient_errors = False
+    
     def __init__(self, api_key_env_var: str):
         """
         Initialize base client.
@@ -40,6 +50,48 @@ class BaseAIClient(ABC):
         """
         pass
     
+    def stream_response(self, model: str, prompt: str) -> Iterator[str]:
+        """
+        Stream response text from AI model as it is generated.
+        
+        Providers without streaming support yield the complete response
+        as a single chunk.
+        
+        Args:
+            model: Model identifier
+            prompt: Input prompt
+            
+        Yields:
+            Chunks of response text
+            
+        Raises:
+            APIError: If the API call fails
+        """
+        yield self.get_response(model, prompt)
+    
+    @staticmethod
+    def _iter_sse_content(response) -> Iterator[str]:
+        """
+        Yield content deltas from an OpenAI-compatible server-sent event stream.
+        
+        Args:
+            response: Streaming requests response
+            
+        Yields:
+            Chunks of response text
+        """
+        for line in response.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            choices = serialization.loads(data).get("choices") or []
+            if choices:
+                content = (choices[0].get("delta") or {}).get("content")
+                if content:
+                    yield content
+    
     def is_available(self) -> bool:
         """
         Check if the client is properly configured.
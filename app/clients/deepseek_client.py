@@ -2,15 +2,32 @@
 Deepseek API client implementation.
 """
 
+import time
 import logging
 import requests
-from typing import Optional
+from types import MappingProxyType
+from typing import Final, Iterator, Mapping, Optional
+from urllib3.util.retry import Retry
 
-from .base_client import BaseAIClient
-from app.utils.exceptions import APIError
+from .base_client import BaseAIClient, is_transient_status
+from app.utils.exceptions import APIError, TransientAPIError
+from app.utils import serialization
+from app.utils.http import create_session
 
 logger = logging.getLogger(__name__)
 
+# Seconds an endpoint stays demoted after a failure, doubled per consecutive
+# failure up to MAX_COOLDOWN
+BASE_COOLDOWN = 30
+MAX_COOLDOWN = 300
+
+# Friendly model names to API model identifiers
+MODEL_MAP: Final[Mapping[str, str]] = MappingProxyType({
+    "deepseek-chat": "deepseek-llm-7b-chat",
+    "deepseek-coder": "deepseek-coder-7b-instruct"
+})
+DEFAULT_API_MODEL = "deepseek-llm-7b-chat"
+
 
 class DeepSeekClient(BaseAIClient):
     """Deepseek API client with fallback endpoints."""
@@ -25,11 +42,21 @@ class DeepSeekClient(BaseAIClient):
             "https://api.deepseek.com/v1/chat/completions"
         ]
         
-        # Model mapping from friendly names to API model identifiers
-        self.model_map = {
-            "deepseek-chat": "deepseek-llm-7b-chat",
-            "deepseek-coder": "deepseek-coder-7b-instruct"
+        # Failure tracking so a dead endpoint is not retried on every call
+        self._endpoint_health = {
+            endpoint: {'fails': 0, 'fail_ts': 0.0} for endpoint in self.endpoints
         }
+        self._last_good = None
+        
+        # Keep-alive session shared by all calls. Completions are POSTs,
+        # which are not safe to replay at the HTTP layer, and a dead
+        # endpoint should fall through to the next one immediately, so the
+        # session does not retry; AIService retries the call as a whole.
+        self.session = create_session(
+            Retry(total=0),
+            pool_connections=10,
+            pool_maxsize=20
+        )
     
     def get_response(self, model: str, prompt: str) -> str:
         """
@@ -48,50 +75,161 @@ class DeepSeekClient(BaseAIClient):
         if not self.is_available():
             return self.get_config_error_message()
         
-        # Map friendly model name to actual API model identifier
-        actual_model = self.model_map.get(model, "deepseek-llm-7b-chat")
-        logger.info(f"Making request to Deepseek API with model: {actual_model}")
+        payload = self._build_payload(model, prompt)
+        logger.info("Making request to Deepseek API with model: %s", payload['model'])
         
-        # Try each endpoint until one succeeds
-        for endpoint in self.endpoints:
+        # Try each endpoint until one succeeds, healthiest first; the call
+        # is worth retrying only if every endpoint failed transiently
+        transient = True
+        for endpoint in self._ordered_endpoints():
             try:
-                logger.info(f"Trying Deepseek endpoint: {endpoint}")
+                logger.info("Trying Deepseek endpoint: %s", endpoint)
                 
-                response = requests.post(
+                response = self.session.post(
                     endpoint,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": actual_model,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": 0.7,
-                        "max_tokens": 2000
-                    },
+                    headers=self._headers(),
+                    data=serialization.dumps(payload),
                     timeout=15  # Shorter timeout to try multiple endpoints
                 )
                 
-                logger.info(f"Deepseek API response status from {endpoint}: {response.status_code}")
+                logger.info("Deepseek API response status from %s: %s", endpoint, response.status_code)
                 
                 if response.status_code == 200:
-                    logger.info(f"Deepseek API request successful on {endpoint}")
-                    return response.json()["choices"][0]["message"]["content"]
+                    logger.info("Deepseek API request successful on %s", endpoint)
+                    self._mark_success(endpoint)
+                    return serialization.loads(response.content)["choices"][0]["message"]["content"]
                 else:
                     logger.error(f"Deepseek API error on {endpoint}: {response.status_code} - {response.text}")
+                    self._mark_failure(endpoint)
+                    transient = transient and is_transient_status(response.status_code)
                     
             except requests.exceptions.RequestException as e:
                 logger.warning(f"Connection to Deepseek endpoint {endpoint} failed: {e}")
+                self._mark_failure(endpoint)
+                transient = transient and isinstance(
+                    e, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+                )
                 continue
             except Exception as e:
                 logger.error(f"Unexpected error with Deepseek endpoint {endpoint}: {e}")
+                self._mark_failure(endpoint)
+                transient = False
                 continue
         
         # If all endpoints failed, raise an error
+        error_msg = "All Deepseek endpoints failed"
+        logger.error(error_msg)
+        raise (TransientAPIError if transient else APIError)(error_msg)
+    
+    def stream_response(self, model: str, prompt: str) -> Iterator[str]:
+        """
+        Stream response from Deepseek model as it is generated.
+        
+        Endpoints are tried in health order until one accepts the request;
+        once tokens start flowing the stream stays on that endpoint.
+        
+        Args:
+            model: Deepseek model identifier
+            prompt: Input prompt
+            
+        Yields:
+            Chunks of response text
+            
+        Raises:
+            APIError: If no endpoint accepts the request or the stream breaks
+        """
+        if not self.is_available():
+            yield self.get_config_error_message()
+            return
+        
+        payload = self._build_payload(model, prompt, stream=True)
+        
+        for endpoint in self._ordered_endpoints():
+            try:
+                response = self.session.post(
+                    endpoint,
+                    headers=self._headers(),
+                    data=serialization.dumps(payload),
+                    timeout=15,
+                    stream=True
+                )
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Connection to Deepseek endpoint {endpoint} failed: {e}")
+                self._mark_failure(endpoint)
+                continue
+            
+            if response.status_code != 200:
+                logger.error(f"Deepseek API error on {endpoint}: {response.status_code} - {response.text}")
+                self._mark_failure(endpoint)
+                response.close()
+                continue
+            
+            self._mark_success(endpoint)
+            with response:
+                try:
+                    yield from self._iter_sse_content(response)
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    error_msg = f"Deepseek stream from {endpoint} failed: {e}"
+                    logger.error(error_msg)
+                    raise APIError(error_msg) from e
+            return
+        
         error_msg = "All Deepseek endpoints failed"
         logger.error(error_msg)
         raise APIError(error_msg)
     
+    def _headers(self) -> dict:
+        """Build request headers for the Deepseek API."""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+    
+    def _build_payload(self, model: str, prompt: str, stream: bool = False) -> dict:
+        """Build a chat completion payload, mapping friendly model names."""
+        payload = {
+            "model": MODEL_MAP.get(model, DEFAULT_API_MODEL),
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.7,
+            "max_tokens": 2000
+        }
+        if stream:
+            payload["stream"] = True
+        return payload
+    
+    def _ordered_endpoints(self) -> list:
+        """
+        Order endpoints so the last working one is tried first.
+        
+        Endpoints still cooling down after recent failures go last; once
+        the cool-down expires they are tried normally again.
+        
+        Returns:
+            Endpoints in the order they should be attempted
+        """
+        now = time.time()
+        
+        def rank(endpoint):
+            health = self._endpoint_health[endpoint]
+            cooldown = min(BASE_COOLDOWN * 2 ** max(health['fails'] - 1, 0), MAX_COOLDOWN)
+            cooling = health['fails'] > 0 and now - health['fail_ts'] < cooldown
+            return (cooling, endpoint != self._last_good)
+        
+        return sorted(self.endpoints, key=rank)
+    
+    def _mark_success(self, endpoint: str) -> None:
+        """Reset failure tracking for an endpoint that just worked."""
+        self._endpoint_health[endpoint] = {'fails': 0, 'fail_ts': 0.0}
+        self._last_good = endpoint
+    
+    def _mark_failure(self, endpoint: str) -> None:
+        """Record a failure and start the endpoint's cool-down."""
+        health = self._endpoint_health[endpoint]
+        health['fails'] += 1
+        health['fail_ts'] = time.time()
+        if self._last_good == endpoint:
+            self._last_good = None
+    
     def is_available(self) -> bool:
         """Check if Deepseek client is properly configured."""
         return bool(self.api_key)
@@ -4,31 +4,115 @@ OpenAI API client implementation.
 
 import os
 import re
-import time
-import random
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 
 import openai
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from .base_client import BaseAIClient
-from app.utils.exceptions import APIError
+from app.utils.exceptions import APIError, TransientAPIError
 
 logger = logging.getLogger(__name__)
 
+# Parses rate limit reset durations such as "20ms", "1.5s" or "6m0s"
+RESET_DURATION_PATTERN = re.compile(r"([\d.]+)(ms|s|m|h)")
+DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+MAX_ATTEMPTS = 5
+MAX_RETRY_WAIT = 60
+
+# Errors worth retrying; anything else (bad request, auth) fails immediately
+TRANSIENT_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+_backoff = wait_exponential_jitter(initial=1, max=30, jitter=0.5)
+
+
+def _parse_reset_duration(value: str) -> Optional[float]:
+    """
+    Convert an x-ratelimit-reset-* header value to seconds.
+    
+    Args:
+        value: Duration string such as "6m0s"
+        
+    Returns:
+        Seconds until the limit resets, or None if the value is not a duration
+    """
+    parts = RESET_DURATION_PATTERN.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Read the server-suggested retry delay from an OpenAI error's headers.
+    
+    Args:
+        error: Exception raised by the OpenAI client
+        
+    Returns:
+        Seconds to wait, or None if the server gave no hint
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+    
+    reset = headers.get("x-ratelimit-reset-requests")
+    return _parse_reset_duration(reset) if reset else None
+
+
+def _wait_for_retry(retry_state) -> float:
+    """Wait as long as the server asks, else back off exponentially with jitter."""
+    retry_after = _retry_after_seconds(retry_state.outcome.exception())
+    if retry_after is not None:
+        return min(retry_after, MAX_RETRY_WAIT)
+    return _backoff(retry_state)
+
+
+def _log_retry(retry_state) -> None:
+    """Log each retry before sleeping."""
+    logger.info(
+        "OpenAI API call failed (attempt %d): %s; retrying in %.2f seconds...",
+        retry_state.attempt_number,
+        retry_state.outcome.exception(),
+        retry_state.next_action.sleep
+    )
+
 
 class OpenAIClient(BaseAIClient):
     """OpenAI API client with retry logic and error handling."""
     
+    retries_transient_errors = True
+    
     def __init__(self):
         """Initialize OpenAI client."""
         super().__init__('OPENAI_API_KEY')
         
         if self.api_key:
             try:
-                # Initialize with only required parameters (OpenAI v1.x)
+                # Initialize with only required parameters (OpenAI v1.x);
+                # retries are handled by _safe_create, not the SDK
                 self.client = openai.OpenAI(
-                    api_key=self.api_key
+                    api_key=self.api_key,
+                    max_retries=0
                 )
                 # Test the client with a simple call to ensure it's working
                 logger.info("OpenAI client initialized successfully")
@@ -37,7 +121,7 @@ class OpenAIClient(BaseAIClient):
                 logger.error(f"OpenAI client initialization failed due to parameter error: {e}")
                 try:
                     # Fallback: Try with just the API key
-                    self.client = openai.OpenAI(api_key=self.api_key)
+                    self.client = openai.OpenAI(api_key=self.api_key, max_retries=0)
                     logger.info("OpenAI client initialized with fallback parameters")
                 except Exception as fallback_e:
                     logger.error(f"OpenAI client fallback initialization failed: {fallback_e}")
@@ -63,14 +147,7 @@ class OpenAIClient(BaseAIClient):
         Raises:
             APIError: If API call fails after retries
         """
-        if not self.is_available():
-            error_msg = self.get_config_error_message()
-            if not self.api_key:
-                error_msg += " No API key found."
-            elif not self.client:
-                error_msg += " Client initialization failed."
-            logger.error(error_msg)
-            raise APIError(error_msg)
+        self._ensure_available()
         
         try:
             response = self._safe_create(
@@ -79,15 +156,80 @@ class OpenAIClient(BaseAIClient):
             )
             return response.choices[0].message.content
             
+        except TRANSIENT_ERRORS as e:
+            error_msg = f"Error with OpenAI API after retries: {e}"
+            logger.error(error_msg)
+            raise TransientAPIError(error_msg) from e
+        except Exception as e:
+            error_msg = f"Error with OpenAI API: {e}"
+            logger.error(error_msg)
+            raise APIError(error_msg) from e
+    
+    def stream_response(self, model: str, prompt: str) -> Iterator[str]:
+        """
+        Stream response from OpenAI model token by token.
+        
+        Args:
+            model: OpenAI model identifier (e.g., 'gpt-4o-mini', 'gpt-4')
+            prompt: Input prompt
+            
+        Yields:
+            Chunks of response text as they arrive
+            
+        Raises:
+            APIError: If the API call fails
+        """
+        self._ensure_available()
+        
+        try:
+            stream = self._safe_create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                stream=True
+            )
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if content:
+                    yield content
+                    
         except Exception as e:
             error_msg = f"Error with OpenAI API: {e}"
             logger.error(error_msg)
             raise APIError(error_msg) from e
     
+    def _ensure_available(self) -> None:
+        """
+        Raise if the client cannot make API calls.
+        
+        Raises:
+            APIError: If the API key is missing or the client failed to initialize
+        """
+        if not self.is_available():
+            error_msg = self.get_config_error_message()
+            if not self.api_key:
+                error_msg += " No API key found."
+            elif not self.client:
+                error_msg += " Client initialization failed."
+            logger.error(error_msg)
+            raise APIError(error_msg)
+    
+    @retry(
+        retry=retry_if_exception_type(TRANSIENT_ERRORS),
+        wait=_wait_for_retry,
+        stop=stop_after_attempt(MAX_ATTEMPTS),
+        before_sleep=_log_retry,
+        reraise=True,
+    )
     def _safe_create(self, **kwargs):
         """
         Safely create a request to OpenAI API with retries.
         
+        Transient errors are retried with exponential backoff, honoring the
+        Retry-After and x-ratelimit-reset-requests headers on rate limit
+        responses.
+        
         Args:
             **kwargs: Arguments to pass to the OpenAI API
             
@@ -95,38 +237,9 @@ class OpenAIClient(BaseAIClient):
             OpenAI API response
             
         Raises:
-            APIError: If all retries are exhausted
+            openai.OpenAIError: If the call fails or all retries are exhausted
         """
-        max_retries = 5
-        
-        for attempt in range(max_retries):
-            try:
-                return self.client.chat.completions.create(**kwargs)
-                
-            except openai.RateLimitError as e:
-                retry_after = 20  # Default retry time
-                
-                # Extract retry time from error message if available
-                if "Please try again in" in str(e):
-                    try:
-                        retry_after = float(
-                            re.search(r"try again in ([\d.]+)", str(e)).group(1)
-                        )
-                    except (AttributeError, ValueError):
-                        pass
-                
-                # Add jitter to avoid thundering herd
-                sleep_time = retry_after + (random.random() * 0.5)
-                logger.info(f"Rate limit hit, retrying in {sleep_time:.2f} seconds...")
-                time.sleep(sleep_time)
-                
-            except Exception as e:
-                logger.error(f"Error during OpenAI API call (attempt {attempt + 1}): {e}")
-                if attempt == max_retries - 1:
-                    raise
-                time.sleep(2 ** attempt)  # Exponential backoff
-        
-        raise APIError("Max retries exceeded for OpenAI API call")
+        return self.client.chat.completions.create(**kwargs)
     
     def is_available(self) -> bool:
         """Check if OpenAI client is properly configured."""
@@ -4,13 +4,24 @@ Perplexity API client implementation.
 
 import logging
 import requests
-from typing import Optional
+from types import MappingProxyType
+from typing import Final, Iterator, Mapping, Optional
+from urllib3.util.retry import Retry
 
-from .base_client import BaseAIClient
-from app.utils.exceptions import APIError
+from .base_client import BaseAIClient, is_transient_status
+from app.utils.exceptions import APIError, TransientAPIError
+from app.utils import serialization
+from app.utils.http import create_session
 
 logger = logging.getLogger(__name__)
 
+# Friendly model names to API model identifiers
+MODEL_MAP: Final[Mapping[str, str]] = MappingProxyType({
+    "perplexity-online-llama3": "pplx-7b-online",
+    "perplexity-sonar-small-online": "pplx-70b-online"
+})
+DEFAULT_API_MODEL = "sonar-small-chat"
+
 
 class PerplexityClient(BaseAIClient):
     """Perplexity API client."""
@@ -21,11 +32,15 @@ class PerplexityClient(BaseAIClient):
         
         self.endpoint = "https://api.perplexity.ai/chat/completions"
         
-        # Model mapping from friendly names to API model identifiers
-        self.model_map = {
-            "perplexity-online-llama3": "pplx-7b-online",
-            "perplexity-sonar-small-online": "pplx-70b-online"
-        }
+        # Keep-alive session shared by all calls. Only failed connections
+        # are retried: the default allowed_methods excludes POST, so a
+        # completion request that reached the server is never replayed.
+        # AIService retries rate limits and server errors as a whole.
+        self.session = create_session(
+            Retry(total=3, backoff_factor=0.3),
+            pool_connections=10,
+            pool_maxsize=20
+        )
     
     def get_response(self, model: str, prompt: str) -> str:
         """
@@ -44,39 +59,38 @@ class PerplexityClient(BaseAIClient):
         if not self.is_available():
             return self.get_config_error_message()
         
-        # Map friendly model name to actual API model identifier
-        actual_model = self.model_map.get(model, "sonar-small-chat")
-        logger.info(f"Making request to Perplexity API with model: {actual_model}")
-        logger.info(f"Using endpoint: {self.endpoint}")
+        payload = self._build_payload(model, prompt)
+        logger.info("Making request to Perplexity API with model: %s", payload['model'])
+        logger.info("Using endpoint: %s", self.endpoint)
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.endpoint,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": actual_model,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": 0.7,
-                    "max_tokens": 2000
-                },
+                headers=self._headers(),
+                data=serialization.dumps(payload),
                 timeout=60
             )
             
             # Log response status for debugging
-            logger.info(f"Perplexity API response status: {response.status_code}")
+            logger.info("Perplexity API response status: %s", response.status_code)
             
             if response.status_code == 200:
                 logger.info("Perplexity API request successful")
-                return response.json()["choices"][0]["message"]["content"]
+                return serialization.loads(response.content)["choices"][0]["message"]["content"]
             else:
                 # More detailed error logging
                 error_msg = f"Perplexity API error: {response.status_code} - {response.text}"
                 logger.error(error_msg)
+                if is_transient_status(response.status_code):
+                    raise TransientAPIError(error_msg)
                 raise APIError(error_msg)
                 
+        except APIError:
+            raise
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            error_msg = f"Network error with Perplexity API: {e}"
+            logger.error(error_msg)
+            raise TransientAPIError(error_msg) from e
         except requests.exceptions.RequestException as e:
             error_msg = f"Network error with Perplexity API: {e}"
             logger.error(error_msg)
@@ -86,6 +100,63 @@ class PerplexityClient(BaseAIClient):
             logger.error(error_msg)
             raise APIError(error_msg) from e
     
+    def stream_response(self, model: str, prompt: str) -> Iterator[str]:
+        """
+        Stream response from Perplexity model as it is generated.
+        
+        Args:
+            model: Perplexity model identifier
+            prompt: Input prompt
+            
+        Yields:
+            Chunks of response text
+            
+        Raises:
+            APIError: If API call fails
+        """
+        if not self.is_available():
+            yield self.get_config_error_message()
+            return
+        
+        try:
+            with self.session.post(
+                self.endpoint,
+                headers=self._headers(),
+                data=serialization.dumps(self._build_payload(model, prompt, stream=True)),
+                timeout=60,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    error_msg = f"Perplexity API error: {response.status_code} - {response.text}"
+                    logger.error(error_msg)
+                    raise APIError(error_msg)
+                
+                yield from self._iter_sse_content(response)
+                
+        except (requests.exceptions.RequestException, ValueError) as e:
+            error_msg = f"Network error with Perplexity API: {e}"
+            logger.error(error_msg)
+            raise APIError(error_msg) from e
+    
+    def _headers(self) -> dict:
+        """Build request headers for the Perplexity API."""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+    
+    def _build_payload(self, model: str, prompt: str, stream: bool = False) -> dict:
+        """Build a chat completion payload, mapping friendly model names."""
+        payload = {
+            "model": MODEL_MAP.get(model, DEFAULT_API_MODEL),
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.7,
+            "max_tokens": 2000
+        }
+        if stream:
+            payload["stream"] = True
+        return payload
+    
     def is_available(self) -> bool:
         """Check if Perplexity client is properly configured."""
         return bool(self.api_key)
@@ -1,14 +1,112 @@
 """Application configuration management."""
 
 import os
+import secrets
+import tempfile
+from functools import lru_cache
 from typing import Dict, Any
 from pathlib import Path
 
+DEV_SECRET_KEY_FILE = Path(__file__).parent.parent / '.dev_secret_key'
+
+TRUE_VALUES = frozenset({'1', 'true', 'yes', 'on'})
+FALSE_VALUES = frozenset({'0', 'false', 'no', 'off'})
+
+
+def env_int(name: str, default: int) -> int:
+    """
+    Read an integer environment variable.
+    
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or empty
+        
+    Returns:
+        Parsed integer
+        
+    Raises:
+        ValueError: If the variable is set but is not an integer
+    """
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """
+    Read a boolean environment variable.
+    
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or empty
+        
+    Returns:
+        Parsed boolean
+        
+    Raises:
+        ValueError: If the variable is set but is not a recognized boolean
+    """
+    value = os.getenv(name)
+    if not value:
+        return default
+    value = value.strip().lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    raise ValueError(f"{name} must be a boolean, got {value!r}")
+
+
+def dev_secret_key(path: Path = DEV_SECRET_KEY_FILE) -> str:
+    """
+    Return a persistent secret key for local development.
+    
+    The key is generated once and stored in path, so every worker and every
+    debug reload signs sessions with the same key. The file is published with
+    an atomic hard link, so when several workers start at once exactly one
+    key wins and the others read it back.
+    
+    Args:
+        path: File the key is kept in
+        
+    Returns:
+        Hex-encoded secret key
+    """
+    try:
+        key = path.read_text().strip()
+        if key:
+            return key
+    except OSError:
+        pass
+    
+    key = secrets.token_hex(32)
+    try:
+        # mkstemp creates the file with mode 0600
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix='.dev_secret_key.')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(key)
+            os.link(tmp_name, path)
+        finally:
+            os.unlink(tmp_name)
+    except FileExistsError:
+        # Another worker created the key first
+        return path.read_text().strip()
+    except OSError:
+        # Read-only checkout: the key still holds for this process
+        pass
+    return key
+
+
 class Config:
     """Base configuration class."""
     
     # Flask settings
-    SECRET_KEY = os.getenv('SECRET_KEY', os.urandom(24))
+    SECRET_KEY = os.getenv('SECRET_KEY')
     TEMPLATES_AUTO_RELOAD = True
     
     # API Keys
@@ -26,15 +124,24 @@ class Config:
     # Application settings
     BASE_DIR = Path(__file__).parent.parent
     LOG_DIR = BASE_DIR / 'logs'
-    CACHE_SIZE = int(os.getenv('CACHE_SIZE', '100'))
+    CACHE_SIZE = env_int('CACHE_SIZE', 100)
+    CACHE_TTL = env_int('CACHE_TTL', 86400)
+    REDIS_URL = os.getenv('REDIS_URL')
     
     # Model settings
     DEFAULT_MODEL = os.getenv('DEFAULT_MODEL', 'gpt-4o-mini')
-    MAX_TEXT_LENGTH = int(os.getenv('MAX_TEXT_LENGTH', '10000'))
+    MAX_TEXT_LENGTH = env_int('MAX_TEXT_LENGTH', 10000)
     
     # Rate limiting
-    RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
-    RATE_LIMIT_PER_MINUTE = int(os.getenv('RATE_LIMIT_PER_MINUTE', '60'))
+    RATE_LIMIT_ENABLED = env_bool('RATE_LIMIT_ENABLED', True)
+    RATE_LIMIT_PER_MINUTE = env_int('RATE_LIMIT_PER_MINUTE', 60)
+    
+    # Response compression (applied when flask-compress is installed);
+    # streamed responses such as server-sent events are left uncompressed
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_MIMETYPES = ['application/json', 'text/html']
+    COMPRESS_MIN_SIZE = 512
+    COMPRESS_STREAMS = False
     
     @classmethod
     def init_app(cls, app):
@@ -46,6 +153,15 @@ class DevelopmentConfig(Config):
     """Development configuration."""
     DEBUG = True
     TESTING = False
+    
+    @classmethod
+    def init_app(cls, app):
+        """Initialize development configuration."""
+        super().init_app(app)
+        
+        # Fall back to a locally persisted key only outside production
+        if not app.config.get('SECRET_KEY'):
+            app.config['SECRET_KEY'] = dev_secret_key()
 
 class ProductionConfig(Config):
     """Production configuration."""
@@ -70,6 +186,14 @@ class TestingConfig(Config):
     
     # Use in-memory cache for testing
     CACHE_SIZE = 10
+    
+    @classmethod
+    def init_app(cls, app):
+        """Initialize testing configuration."""
+        super().init_app(app)
+        
+        if not app.config.get('SECRET_KEY'):
+            app.config['SECRET_KEY'] = dev_secret_key()
 
 # Configuration mapping
 config_map: Dict[str, Any] = {
@@ -79,8 +203,15 @@ config_map: Dict[str, Any] = {
     'default': DevelopmentConfig
 }
 
+@lru_cache(maxsize=None)
 def get_config(config_name: str = None) -> Config:
-    """Get configuration based on environment."""
+    """
+    Get configuration based on environment.
+    
+    Environment variables are parsed once when this module is imported, and
+    the selected class is cached so repeated app factory calls do not touch
+    os.environ again.
+    """
     if config_name is None:
         config_name = os.getenv('FLASK_ENV', 'default')
     return config_map.get(config_name, DevelopmentConfig)
@@ -25,6 +25,10 @@ def create_app(config_class=None):
                 template_folder='../templates',
                 static_folder='../static')
     
+    # Serialize API responses with orjson
+    from app.utils.serialization import OrjsonProvider
+    app.json = OrjsonProvider(app)
+    
     # Load configuration
     if config_class is None:
         from app.config import get_config
@@ -48,6 +52,13 @@ def create_app(config_class=None):
     from app.utils.exceptions import register_error_handlers
     register_error_handlers(app)
     
+    # Compress large JSON and HTML responses
+    try:
+        from flask_compress import Compress
+        Compress(app)
+    except ImportError:
+        logging.info("flask-compress not installed, responses are sent uncompressed")
+    
     return app
 
 def main():
@@ -64,7 +75,8 @@ def main():
     app.run(
         debug=debug,
         host='0.0.0.0',
-        port=port
+        port=port,
+        threaded=True
     )
 
 if __name__ == '__main__':
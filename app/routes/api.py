@@ -6,38 +6,90 @@ MetaFunction's paper analysis capabilities.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from flask import Blueprint, request, jsonify
 from werkzeug.exceptions import BadRequest
 
-from app.services.ai_service import AIService
-from app.services.paper_service import PaperService
-from app.utils.validators import validate_request_data
+from app.services.ai_service import get_ai_service
+from app.services.paper_service import get_paper_service
+from app.utils.validators import validate_request_data, validate_query
 from app.utils.exceptions import APIError, ValidationError
 
 # Create blueprint
 api_bp = Blueprint('api', __name__)
 
 # Initialize services
-ai_service = AIService()
-paper_service = PaperService()
+ai_service = get_ai_service()
+paper_service = get_paper_service()
 
 logger = logging.getLogger(__name__)
 
+# Largest number of queries accepted by /analyze_batch
+MAX_BATCH_SIZE = 100
+
+# Batch items wait on paper sources and AI providers, so run them in parallel
+batch_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='analyze')
+
+def _analyze_query(query: str, model: str, use_cache: bool,
+                   include_metadata: bool) -> dict:
+    """
+    Resolve paper context for a query and get the AI response.
+    
+    Args:
+        query: Question or paper identifier
+        model: Validated model identifier
+        use_cache: Whether to use cached responses
+        include_metadata: Whether to include resolved paper metadata
+        
+    Returns:
+        Successful analysis result
+        
+    Raises:
+        APIError: If the AI service fails
+    """
+    # Process paper query
+    paper_result = paper_service.process_query(query)
+    
+    # Build prompt
+    if paper_result.has_content:
+        prompt = paper_service.build_enhanced_prompt(query, paper_result)
+    else:
+        prompt = query
+    
+    # Get AI response
+    response = ai_service.get_response(
+        model=model,
+        prompt=prompt,
+        use_cache=use_cache
+    )
+    
+    # Build response
+    result = {
+        'status': 'success',
+        'response': response,
+        'model_used': model,
+        'has_paper_context': paper_result.has_content
+    }
+    
+    if include_metadata and paper_result.has_content:
+        result['paper_metadata'] = paper_result.to_dict()
+    
+    return result
+
+def _validate_model(model: str) -> None:
+    """Raise ValidationError if the model is not available."""
+    if not ai_service.validate_model(model):
+        available_models = ai_service.get_available_models()
+        raise ValidationError(f"Invalid model '{model}'. Available: {available_models}")
+
 @api_bp.route('/models', methods=['GET'])
 def get_models():
     """Get list of available AI models."""
     try:
-        models = ai_service.get_available_models()
-        model_info = {}
-        
-        for model in models:
-            info = ai_service.get_model_info(model)
-            model_info[model] = info
-        
         return jsonify({
             'status': 'success',
-            'models': models,
-            'model_info': model_info,
+            'models': ai_service.get_available_models(),
+            'model_info': ai_service.models_info,
             'default_model': 'gpt-4o-mini'
         })
         
@@ -77,41 +129,13 @@ def analyze_paper():
         use_cache = data.get('use_cache', True)
         include_metadata = data.get('include_metadata', True)
         
-        logger.info(f"API analyze request - Model: {model}, Query length: {len(query)}")
-        
-        # Validate model
-        if not ai_service.validate_model(model):
-            available_models = ai_service.get_available_models()
-            raise ValidationError(f"Invalid model '{model}'. Available: {available_models}")
+        # Reject bad input before any paper or model work
+        validate_query(query)
+        _validate_model(model)
         
-        # Process paper query
-        paper_result = paper_service.process_query(query)
+        logger.info("API analyze request - Model: %s, Query length: %d", model, len(query))
         
-        # Build prompt
-        if paper_result.has_content:
-            prompt = paper_service.build_enhanced_prompt(query, paper_result)
-        else:
-            prompt = query
-        
-        # Get AI response
-        response = ai_service.get_response(
-            model=model,
-            prompt=prompt,
-            use_cache=use_cache
-        )
-        
-        # Build response
-        result = {
-            'status': 'success',
-            'response': response,
-            'model_used': model,
-            'has_paper_context': paper_result.has_content
-        }
-        
-        if include_metadata and paper_result.has_content:
-            result['paper_metadata'] = paper_result.to_dict()
-        
-        return jsonify(result)
+        return jsonify(_analyze_query(query, model, use_cache, include_metadata))
         
     except ValidationError as e:
         logger.warning(f"Validation error in analyze: {e}")
@@ -137,6 +161,75 @@ def analyze_paper():
             'error': str(e)
         }), 500
 
+@api_bp.route('/analyze_batch', methods=['POST'])
+def analyze_batch():
+    """
+    Analyze several queries in one request.
+    
+    Queries run concurrently; one failing query does not fail the batch.
+    Results are returned in the same order as the queries.
+    
+    Expected JSON payload:
+    {
+        "queries": ["question or identifier", ...],  # up to MAX_BATCH_SIZE
+        "model": "gpt-4o-mini",  # optional
+        "use_cache": true,       # optional
+        "include_metadata": true # optional
+    }
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            raise BadRequest("No JSON data provided")
+        
+        validate_request_data(data, {'queries'})
+        
+        queries = data['queries']
+        if not isinstance(queries, list) or not queries:
+            raise ValidationError("queries must be a non-empty list")
+        if len(queries) > MAX_BATCH_SIZE:
+            raise ValidationError(f"Too many queries. Maximum batch size: {MAX_BATCH_SIZE}")
+        for query in queries:
+            validate_query(query)
+        
+        model = data.get('model', 'gpt-4o-mini')
+        use_cache = data.get('use_cache', True)
+        include_metadata = data.get('include_metadata', True)
+        
+        _validate_model(model)
+        
+        logger.info("API batch analyze request - Model: %s, Queries: %d", model, len(queries))
+        
+        def analyze(query):
+            try:
+                return _analyze_query(query, model, use_cache, include_metadata)
+            except Exception as e:
+                logger.error(f"Batch item failed: {e}")
+                return {'status': 'error', 'error': str(e)}
+        
+        results = list(batch_executor.map(analyze, queries))
+        
+        return jsonify({
+            'status': 'success',
+            'results': results
+        })
+        
+    except ValidationError as e:
+        logger.warning(f"Validation error in analyze_batch: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Validation failed',
+            'error': str(e)
+        }), 400
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in analyze_batch: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Internal server error',
+            'error': str(e)
+        }), 500
+
 @api_bp.route('/paper/resolve', methods=['POST'])
 def resolve_paper():
     """
@@ -163,7 +256,7 @@ def resolve_paper():
         if not any([doi, pmid, title, pmcid]):
             raise ValidationError("At least one identifier (doi, pmid, title, pmcid) is required")
         
-        logger.info(f"API resolve request - DOI: {doi}, PMID: {pmid}, Title: {bool(title)}")
+        logger.info("API resolve request - DOI: %s, PMID: %s, Title: %s", doi, pmid, bool(title))
         
         # Resolve paper
         paper_result = paper_service.resolve_paper(
@@ -217,7 +310,7 @@ def test_paper_sources():
         if not any([doi, pmid, title, pmcid]):
             raise ValidationError("At least one identifier is required")
         
-        logger.info(f"API test sources request")
+        logger.info("API test sources request")
         
         # Test all sources
         test_results = paper_service.test_all_sources(
@@ -266,6 +359,7 @@ def api_health():
             'endpoints': [
                 '/api/models',
                 '/api/analyze',
+                '/api/analyze_batch',
                 '/api/paper/resolve',
                 '/api/paper/test_sources',
                 '/api/health'
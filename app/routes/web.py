@@ -8,27 +8,46 @@ the main chat interface and utility endpoints.
 import uuid
 import logging
 import subprocess
-import json
 import os
 from pathlib import Path
-from flask import Blueprint, render_template, request, session, send_file
+from concurrent.futures import ThreadPoolExecutor
+from flask import (
+    Blueprint, Response, render_template, request, session, send_file,
+    stream_template, stream_with_context
+)
+from markupsafe import escape
 from werkzeug.exceptions import BadRequest
 
-from app.services.ai_service import AIService
-from app.services.paper_service import PaperService
-from app.services.logging_service import LoggingService
+from app.services.ai_service import get_ai_service
+from app.services.cache_service import TTLCache
+from app.services.paper_service import get_paper_service
 from app.services.logging_service import LoggingService
+from app.utils import serialization
+from app.utils.exceptions import APIError, ModelNotFoundError
 
 # Create blueprint
 web_bp = Blueprint('web', __name__)
 
 # Initialize services (these will be dependency-injected in production)
-ai_service = AIService()
-paper_service = PaperService()
+ai_service = get_ai_service()
+paper_service = get_paper_service()
 logging_service = LoggingService()
 
 logger = logging.getLogger(__name__)
 
+# GitHub Actions dashboard reports are reused for this many seconds
+GITHUB_REPORT_TTL = 60
+github_report_cache = TTLCache(ttl=GITHUB_REPORT_TTL)
+
+def _render_index(default_model: str = "gpt-4o-mini", **context):
+    """Render the chat page with the model dropdown."""
+    return render_template(
+        "index.html",
+        models=ai_service.get_available_models(),
+        default_model=default_model,
+        **context
+    )
+
 @web_bp.route('/')
 def index():
     """Render the index page with model selection dropdown."""
@@ -36,17 +55,43 @@ def index():
     if "session_id" not in session:
         session["session_id"] = str(uuid.uuid4())
     
-    # Get available models from AI service
-    models = ai_service.get_available_models()
-    default_model = "gpt-4o-mini"
+    logger.info("Index page loaded for session %s", session['session_id'])
     
-    logger.info(f"Index page loaded for session {session['session_id']}")
+    return _render_index()
+
+def _answer_chat(user_input: str, selected_model: str, use_cache: bool):
+    """
+    Resolve paper context for a chat query and get the model's answer.
     
-    return render_template(
-        "index.html", 
-        models=models, 
-        default_model=default_model
+    Returns:
+        Tuple of the response text and the PaperResult
+    """
+    if paper_service.is_metadata_only_query(user_input):
+        # The answer only needs the citation record, so skip full-text
+        # resolution and give the model the bibliographic details
+        logger.info("Metadata-only query, looking up the citation record")
+        paper_result = paper_service.lookup_metadata(user_input)
+        prompt = paper_service.build_metadata_prompt(user_input, paper_result)
+    else:
+        # Process the paper query if it contains identifiers
+        paper_result = paper_service.process_query(user_input)
+        
+        # Build enhanced prompt with paper context
+        if paper_result.has_content:
+            prompt = paper_service.build_enhanced_prompt(user_input, paper_result)
+            logger.info("Using enhanced context with paper details")
+        else:
+            prompt = user_input
+            logger.info("No paper details found, using original query")
+    
+    # Get AI response
+    response = ai_service.get_response(
+        model=selected_model,
+        prompt=prompt,
+        use_cache=use_cache
     )
+    
+    return response, paper_result
 
 @web_bp.route('/chat', methods=['POST'])
 def chat():
@@ -61,43 +106,37 @@ def chat():
         if not user_input:
             raise BadRequest("No input provided")
         
-        logger.info(f"Processing chat request for session {session_id}")
-        logger.info(f"Selected model: {selected_model}, Input length: {len(user_input)}")
-        
-        # Process the paper query if it contains identifiers
-        paper_result = paper_service.process_query(user_input)
+        logger.info(
+            "Processing chat request for session %s - Model: %s, Input length: %d",
+            session_id, selected_model, len(user_input)
+        )
         
-        # Build enhanced prompt with paper context
-        if paper_result.has_content:
-            prompt = paper_service.build_enhanced_prompt(user_input, paper_result)
-            logger.info("Using enhanced context with paper details")
+        use_cache = not ignore_cache
+        cached = ai_service.get_cached_answer(selected_model, user_input) if use_cache else None
+        if cached is not None:
+            logger.info("Serving cached answer without resolving the paper")
+            response, paper_info = cached['response'], cached['paper_info']
         else:
-            prompt = user_input
-            logger.info("No paper details found, using original query")
-        
-        # Get AI response
-        response = ai_service.get_response(
-            model=selected_model,
-            prompt=prompt,
-            use_cache=not ignore_cache
-        )
+            response, paper_result = _answer_chat(user_input, selected_model, use_cache)
+            paper_info = paper_result.to_dict()
+            
+            if use_cache and response:
+                ai_service.cache_answer(selected_model, user_input, response, paper_info)
         
         # Log the interaction
         logging_service.log_chat(
             session_id=session_id,
             user_input=user_input,
             response=response,
-            paper_info=paper_result.to_dict(),
+            paper_info=paper_info,
             model=selected_model
         )
         
         # Render response
-        return render_template(
-            "index.html",
-            models=ai_service.get_available_models(),
+        return _render_index(
             default_model=selected_model,
             response=response,
-            paper_info=paper_result.to_dict()
+            paper_info=paper_info
         )
         
     except BadRequest as e:
@@ -108,11 +147,55 @@ def chat():
         error_message = f"An error occurred: {str(e)}"
     
     # Error response
-    return render_template(
-        "index.html",
-        models=ai_service.get_available_models(),
-        default_model="gpt-4o-mini",
-        response=error_message
+    return _render_index(response=error_message)
+
+@web_bp.route('/chat_stream', methods=['POST'])
+def chat_stream():
+    """Stream the model response to the client as server-sent events."""
+    user_input = request.form.get("message") or request.form.get("user_input", "").strip()
+    selected_model = request.form.get("model", "gpt-4o-mini")
+    session_id = session.get("session_id", "unknown")
+    ignore_cache = request.form.get("ignore_cache") == "true"
+    
+    if not user_input:
+        raise BadRequest("No input provided")
+    
+    logger.info("Processing streaming chat request for session %s", session_id)
+    
+    paper_result = paper_service.process_query(user_input)
+    if paper_result.has_content:
+        prompt = paper_service.build_enhanced_prompt(user_input, paper_result)
+    else:
+        prompt = user_input
+    
+    def generate():
+        chunks = []
+        try:
+            for chunk in ai_service.stream_response(
+                model=selected_model,
+                prompt=prompt,
+                use_cache=not ignore_cache
+            ):
+                chunks.append(chunk)
+                yield f"data: {serialization.dumps(chunk).decode()}\n\n"
+        except (ModelNotFoundError, APIError) as e:
+            logger.error(f"Streaming chat failed: {e}")
+            yield f"event: error\ndata: {serialization.dumps(str(e)).decode()}\n\n"
+            return
+        
+        logging_service.log_chat(
+            session_id=session_id,
+            user_input=user_input,
+            response="".join(chunks),
+            paper_info=paper_result.to_dict(),
+            model=selected_model
+        )
+        yield "event: done\ndata: {}\n\n"
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
     )
 
 @web_bp.route('/download_log')
@@ -121,7 +204,16 @@ def download_log():
     log_file = logging_service.get_chat_log_path()
     
     if log_file.exists():
-        return send_file(log_file, as_attachment=True)
+        # Conditional requests get 304s and Range support; the file is
+        # streamed from disk rather than read into memory
+        return send_file(
+            log_file,
+            as_attachment=True,
+            conditional=True,
+            etag=True,
+            last_modified=log_file.stat().st_mtime,
+            max_age=0
+        )
     else:
         return "No log file found.", 404
 
@@ -131,7 +223,17 @@ def download_metadata():
     metadata_file = logging_service.get_metadata_log_path()
     
     if metadata_file.exists():
-        return send_file(metadata_file, as_attachment=True)
+        # The log is stored as JSON Lines; serve it as a JSON array
+        stat = metadata_file.stat()
+        response = Response(
+            logging_service.iter_metadata_json(),
+            mimetype='application/json',
+            headers={'Content-Disposition': 'attachment; filename=metadata_log.json'}
+        )
+        response.set_etag(f"{stat.st_mtime_ns:x}-{stat.st_size:x}")
+        response.last_modified = stat.st_mtime
+        response.cache_control.max_age = 0
+        return response.make_conditional(request)
     else:
         return "No metadata file found.", 404
 
@@ -139,31 +241,33 @@ def download_metadata():
 def view_metadata():
     """View metadata in HTML format."""
     try:
-        metadata_entries = logging_service.get_metadata_entries()
-        
-        if not metadata_entries:
-            return "<h3>No metadata logged yet.</h3>"
+        metadata_file = logging_service.get_metadata_log_path()
+        stat = metadata_file.stat() if metadata_file.exists() else None
         
-        # Build HTML table
-        html = "<h2>Metadata Log</h2><table border=1 cellpadding=6>"
-        html += "<tr><th>Timestamp</th><th>Title</th><th>DOI</th><th>PMID</th><th>Datasets</th><th>Treatments</th></tr>"
+        # Unchanged log: let the client reuse its copy without re-rendering
+        if stat is not None:
+            etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+            if request.if_none_match.contains(etag):
+                response = Response(status=304)
+                response.set_etag(etag)
+                return response
         
-        for entry in metadata_entries:
-            html += f"<tr>"
-            html += f"<td>{entry.get('timestamp', '')}</td>"
-            html += f"<td>{entry.get('title', '')}</td>"
-            html += f"<td>{entry.get('doi', '')}</td>"
-            html += f"<td>{entry.get('pmid', '')}</td>"
-            html += f"<td>{', '.join(entry.get('datasets', []))}</td>"
-            html += f"<td>{', '.join(entry.get('treatments', []))}</td>"
-            html += "</tr>"
+        metadata_entries = logging_service.get_metadata_entries()
         
-        html += "</table>"
-        return html
+        # Rows are rendered and sent incrementally, with values autoescaped
+        response = Response(
+            stream_template('metadata.html', entries=metadata_entries),
+            mimetype='text/html'
+        )
+        if stat is not None:
+            response.set_etag(etag)
+            response.last_modified = stat.st_mtime
+        response.cache_control.no_cache = True
+        return response
         
     except Exception as e:
         logger.error(f"Error viewing metadata: {e}")
-        return f"<h3>Error reading metadata: {e}</h3>"
+        return f"<h3>Error reading metadata: {escape(str(e))}</h3>"
 
 @web_bp.route('/test_sources', methods=['GET', 'POST'])
 def test_sources():
@@ -221,8 +325,10 @@ def health_check():
             'timestamp': logging_service.get_current_timestamp()
         }
         
-        status_code = 200 if overall_healthy else 503
-        return health_data, status_code
+        # Probes may reuse a healthy answer briefly; failures are never cached
+        if overall_healthy:
+            return health_data, 200, {'Cache-Control': 'public, max-age=5'}
+        return health_data, 503, {'Cache-Control': 'no-store'}
         
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -230,108 +336,119 @@ def health_check():
             'status': 'unhealthy',
             'error': str(e),
             'timestamp': logging_service.get_current_timestamp()
-        }, 503
+        }, 503, {'Cache-Control': 'no-store'}
 
 @web_bp.route('/favicon.ico')
 def favicon():
     """Serve favicon to prevent 404 errors."""
-    return '', 204  # No content
+    # No content; let browsers keep the answer instead of asking per page
+    return '', 204, {'Cache-Control': 'public, max-age=86400'}
+
+def _run_report_script(cmd):
+    """Run a GitHub Actions report script and capture its output."""
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        return {
+            'stdout': result.stdout,
+            'stderr': result.stderr,
+            'return_code': result.returncode
+        }
+    except Exception as e:
+        logger.error(f"Report script error: {e}")
+        return {'error': str(e)}
+
+def _build_github_actions_report():
+    """Run the validation and monitoring scripts and combine their reports."""
+    # Get paths for scripts
+    validation_script = Path(__file__).parent.parent.parent / 'scripts' / 'validate-github-actions.py'
+    monitoring_script = Path(__file__).parent.parent.parent / 'scripts' / 'github-actions-monitor.py'
+    repo_path = Path(__file__).parent.parent.parent
+    
+    # Get GitHub token from environment
+    github_token = os.environ.get('GITHUB_TOKEN')
+    
+    # Initialize combined report
+    combined_report = {
+        'repository': 'MetaFunction',
+        'timestamp': logging_service.get_current_timestamp(),
+        'validation_results': {
+            'syntax': [{'status': 'unknown', 'message': 'Unable to validate'}],
+            'secrets': [{'status': 'unknown', 'message': 'Token required'}],
+            'dependencies': [{'status': 'unknown', 'message': 'Unable to check'}],
+            'test_files': [{'status': 'unknown', 'message': 'Unable to check'}]
+        },
+        'monitoring_data': {
+            'health': {'level': 'unknown', 'score': 0, 'recommendations': []},
+            'summary': {'total_runs': 0, 'success_rate': 0, 'failure_rate': 0},
+            'recent_runs': [],
+            'alerts': []
+        },
+        'script_outputs': {}
+    }
+    
+    commands = {}
+    if validation_script.exists():
+        commands['validation'] = [
+            'python3', str(validation_script),
+            '--repo-path', str(repo_path),
+            '--output', '/tmp/github_validation_report.json'
+        ]
+    if monitoring_script.exists():
+        commands['monitoring'] = [
+            'python3', str(monitoring_script),
+            '--repo-path', str(repo_path),
+            '--dashboard',
+            '--output', '/tmp/github_monitoring_report.json'
+        ]
+    if github_token:
+        for cmd in commands.values():
+            cmd.extend(['--token', github_token])
+    
+    # Both scripts wait on the GitHub API, so run them side by side
+    if commands:
+        with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+            outputs = dict(zip(commands, executor.map(_run_report_script, commands.values())))
+        combined_report['script_outputs'].update(outputs)
+    
+    # Load validation results
+    if 'validation' in commands:
+        try:
+            if os.path.exists('/tmp/github_validation_report.json'):
+                with open('/tmp/github_validation_report.json', 'rb') as f:
+                    validation_data = serialization.loads(f.read())
+                    combined_report['validation_results'] = validation_data.get('validation_results', combined_report['validation_results'])
+                    
+        except Exception as e:
+            logger.error(f"Validation script error: {e}")
+            combined_report['script_outputs']['validation'] = {'error': str(e)}
+    
+    # Load monitoring results
+    if 'monitoring' in commands:
+        try:
+            if os.path.exists('/tmp/github_monitoring_report.json'):
+                with open('/tmp/github_monitoring_report.json', 'rb') as f:
+                    monitoring_data = serialization.loads(f.read())
+                    combined_report['monitoring_data'] = {
+                        'health': monitoring_data.get('health', combined_report['monitoring_data']['health']),
+                        'summary': monitoring_data.get('summary', combined_report['monitoring_data']['summary']),
+                        'recent_runs': monitoring_data.get('recent_runs', [])[:10],
+                        'alerts': monitoring_data.get('alerts', [])[:5]
+                    }
+                    
+        except Exception as e:
+            logger.error(f"Monitoring script error: {e}")
+            combined_report['script_outputs']['monitoring'] = {'error': str(e)}
+    
+    return combined_report
 
 @web_bp.route('/github-actions')
 def github_actions_dashboard():
     """Enhanced GitHub Actions status dashboard with monitoring."""
     try:
-        # Get paths for scripts
-        validation_script = Path(__file__).parent.parent.parent / 'scripts' / 'validate-github-actions.py'
-        monitoring_script = Path(__file__).parent.parent.parent / 'scripts' / 'github-actions-monitor.py'
-        repo_path = Path(__file__).parent.parent.parent
-        
-        # Get GitHub token from environment
-        github_token = os.environ.get('GITHUB_TOKEN')
-        
-        # Initialize combined report
-        combined_report = {
-            'repository': 'MetaFunction',
-            'timestamp': logging_service.get_current_timestamp(),
-            'validation_results': {
-                'syntax': [{'status': 'unknown', 'message': 'Unable to validate'}],
-                'secrets': [{'status': 'unknown', 'message': 'Token required'}],
-                'dependencies': [{'status': 'unknown', 'message': 'Unable to check'}],
-                'test_files': [{'status': 'unknown', 'message': 'Unable to check'}]
-            },
-            'monitoring_data': {
-                'health': {'level': 'unknown', 'score': 0, 'recommendations': []},
-                'summary': {'total_runs': 0, 'success_rate': 0, 'failure_rate': 0},
-                'recent_runs': [],
-                'alerts': []
-            },
-            'script_outputs': {}
-        }
-        
-        # Run validation script
-        if validation_script.exists():
-            try:
-                cmd = [
-                    'python3', str(validation_script),
-                    '--repo-path', str(repo_path),
-                    '--output', '/tmp/github_validation_report.json'
-                ]
-                
-                if github_token:
-                    cmd.extend(['--token', github_token])
-                
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                combined_report['script_outputs']['validation'] = {
-                    'stdout': result.stdout,
-                    'stderr': result.stderr,
-                    'return_code': result.returncode
-                }
-                
-                # Load validation results
-                if os.path.exists('/tmp/github_validation_report.json'):
-                    with open('/tmp/github_validation_report.json', 'r') as f:
-                        validation_data = json.load(f)
-                        combined_report['validation_results'] = validation_data.get('validation_results', combined_report['validation_results'])
-                        
-            except Exception as e:
-                logger.error(f"Validation script error: {e}")
-                combined_report['script_outputs']['validation'] = {'error': str(e)}
-        
-        # Run monitoring script  
-        if monitoring_script.exists():
-            try:
-                cmd = [
-                    'python3', str(monitoring_script),
-                    '--repo-path', str(repo_path),
-                    '--dashboard',
-                    '--output', '/tmp/github_monitoring_report.json'
-                ]
-                
-                if github_token:
-                    cmd.extend(['--token', github_token])
-                
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                combined_report['script_outputs']['monitoring'] = {
-                    'stdout': result.stdout,
-                    'stderr': result.stderr,
-                    'return_code': result.returncode
-                }
-                
-                # Load monitoring results
-                if os.path.exists('/tmp/github_monitoring_report.json'):
-                    with open('/tmp/github_monitoring_report.json', 'r') as f:
-                        monitoring_data = json.load(f)
-                        combined_report['monitoring_data'] = {
-                            'health': monitoring_data.get('health', combined_report['monitoring_data']['health']),
-                            'summary': monitoring_data.get('summary', combined_report['monitoring_data']['summary']),
-                            'recent_runs': monitoring_data.get('recent_runs', [])[:10],
-                            'alerts': monitoring_data.get('alerts', [])[:5]
-                        }
-                        
-            except Exception as e:
-                logger.error(f"Monitoring script error: {e}")
-                combined_report['script_outputs']['monitoring'] = {'error': str(e)}
-        
+        # Both scripts call the GitHub API, so reuse a recent report
+        combined_report = github_report_cache.get_or_set(
+            'report', _build_github_actions_report
+        )
         return render_template('github_actions_enhanced_dashboard.html', report=combined_report)
         
     except Exception as e:
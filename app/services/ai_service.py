@@ -5,17 +5,34 @@ This service provides a unified interface for interacting with multiple
 AI providers while handling fallbacks, caching, and error management.
 """
 
+import time
 import logging
-from typing import Dict, List, Optional
-from collections import OrderedDict
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
+from tenacity import Retrying, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 from app.clients.openai_client import OpenAIClient
 from app.clients.deepseek_client import DeepSeekClient
 from app.clients.perplexity_client import PerplexityClient
-from app.utils.exceptions import ModelNotFoundError, APIError
+from app.services.cache_service import ResponseCache
+from app.utils import serialization
+from app.utils.exceptions import ModelNotFoundError, APIError, TransientAPIError
 
 logger = logging.getLogger(__name__)
 
+# A provider that fails this many calls in a row is skipped, so requests go
+# straight to the fallback, until CIRCUIT_RESET_TIMEOUT seconds have passed
+CIRCUIT_FAIL_MAX = 5
+CIRCUIT_RESET_TIMEOUT = 30
+
+# Transient failures of clients without their own retry layer are retried
+# with backoff; permanent errors such as a rejected API key are not
+MODEL_RETRY_ATTEMPTS = 3
+_retry_wait = wait_exponential_jitter(initial=0.1, max=2)
+
 class AIService:
     """Service for managing AI model interactions."""
     
@@ -24,10 +41,10 @@ class AIService:
         Initialize AI service.
         
         Args:
-            cache_size: Maximum number of cached responses
+            cache_size: Maximum number of responses cached in-process
         """
         self.cache_size = cache_size
-        self.query_cache = OrderedDict()
+        self.query_cache = ResponseCache(max_size=cache_size)
         
         # Initialize clients
         self.clients = {
@@ -50,9 +67,23 @@ class AIService:
         }
         
         self.fallback_model = 'gpt-4o-mini'
+        
+        # Consecutive failures per client for the circuit breaker
+        self._client_health = {}
+        self._health_lock = threading.Lock()
+        
+        # Client configuration is fixed at startup, so resolve models once
+        self.available_models = self._discover_available_models()
+        self.models_info = {
+            model: self._describe_model(model) for model in self.available_models
+        }
+    
+    def get_available_models(self) -> Tuple[str, ...]:
+        """Get available models based on configured clients."""
+        return self.available_models
     
-    def get_available_models(self) -> List[str]:
-        """Get list of available models based on configured clients."""
+    def _discover_available_models(self) -> Tuple[str, ...]:
+        """Determine which routed models have a configured client."""
         available_models = []
         
         for model, client_name in self.model_routing.items():
@@ -67,7 +98,7 @@ class AIService:
             if openai_client and openai_client.is_available():
                 available_models.append(self.fallback_model)
         
-        return available_models
+        return tuple(available_models)
     
     def get_response(self, model: str, prompt: str, 
                     use_cache: bool = True, fallback_on_error: bool = True) -> str:
@@ -87,42 +118,176 @@ class AIService:
             ModelNotFoundError: If model is not available
             APIError: If all attempts fail
         """
-        # Check cache first
-        if use_cache:
-            cache_key = f"{model}:{hash(prompt)}"
-            cached_response = self.query_cache.get(cache_key)
-            if cached_response:
-                logger.info(f"Using cached response for model {model}")
-                # Move to end (LRU)
-                self.query_cache.move_to_end(cache_key)
-                return cached_response
+        attempts = [model]
+        if fallback_on_error and model != self.fallback_model:
+            attempts.append(self.fallback_model)
         
-        # Get response from model
-        try:
-            response = self._get_model_response(model, prompt)
+        for attempt, attempt_model in enumerate(attempts):
+            # Check cache first
+            if use_cache:
+                cache_key = self._cache_key(attempt_model, prompt)
+                cached_response = self.query_cache.get(cache_key)
+                if cached_response:
+                    logger.info("Using cached response for model %s", attempt_model)
+                    return cached_response
+            
+            # Get response from model
+            try:
+                response = self._get_model_response(attempt_model, prompt)
+            except (ModelNotFoundError, APIError) as e:
+                logger.error(f"Error with model {attempt_model}: {e}")
+                if attempt + 1 == len(attempts):
+                    raise
+                logger.info("Falling back to %s", self.fallback_model)
+                continue
             
             # Cache successful response
             if use_cache and response:
-                self._add_to_cache(cache_key, response)
+                self.query_cache.set(cache_key, response)
             
             return response
+    
+    def get_responses(self, models: List[str], prompt: str,
+                      use_cache: bool = True) -> Dict[str, Dict[str, str]]:
+        """
+        Get responses from several models concurrently.
+        
+        Provider calls are network-bound, so they run in parallel threads and
+        the total wait is the slowest provider rather than the sum of all.
+        
+        Args:
+            models: Model identifiers to query
+            prompt: Input prompt sent to every model
+            use_cache: Whether to use cached responses
             
-        except (ModelNotFoundError, APIError) as e:
-            logger.error(f"Error with model {model}: {e}")
-            
-            if fallback_on_error and model != self.fallback_model:
-                logger.info(f"Falling back to {self.fallback_model}")
-                return self.get_response(
-                    self.fallback_model,
-                    prompt,
-                    use_cache=use_cache,
-                    fallback_on_error=False
+        Returns:
+            Mapping of model to {'status': 'success', 'response': ...} or
+            {'status': 'error', 'error': ...}
+        """
+        def query(model: str) -> Dict[str, str]:
+            try:
+                response = self.get_response(
+                    model, prompt, use_cache=use_cache, fallback_on_error=False
                 )
-            else:
-                raise
+                return {'status': 'success', 'response': response}
+            except (ModelNotFoundError, APIError) as e:
+                return {'status': 'error', 'error': str(e)}
+        
+        if not models:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=len(models)) as executor:
+            return dict(zip(models, executor.map(query, models)))
     
-    def _get_model_response(self, model: str, prompt: str) -> str:
-        """Get response from specific model."""
+    def stream_response(self, model: str, prompt: str,
+                        use_cache: bool = True) -> Iterator[str]:
+        """
+        Stream response from specified AI model.
+        
+        The concatenated reply is cached only once the stream has completed,
+        so an interrupted stream never leaves a partial answer in the cache.
+        
+        Args:
+            model: Model identifier
+            prompt: Input prompt
+            use_cache: Whether to use cached responses
+            
+        Yields:
+            Chunks of response text
+            
+        Raises:
+            ModelNotFoundError: If model is not available
+            APIError: If the API call fails
+        """
+        cache_key = self._cache_key(model, prompt)
+        if use_cache:
+            cached_response = self.query_cache.get(cache_key)
+            if cached_response:
+                logger.info("Using cached response for model %s", model)
+                yield cached_response
+                return
+        
+        client = self._get_client(model)
+        chunks = []
+        try:
+            for chunk in client.stream_response(model, prompt):
+                chunks.append(chunk)
+                yield chunk
+        except APIError:
+            raise
+        except Exception as e:
+            error_msg = f"Error streaming response from {model}: {str(e)}"
+            logger.error(error_msg)
+            raise APIError(error_msg) from e
+        
+        logger.info("Successfully streamed response from %s", model)
+        if use_cache and chunks:
+            self.query_cache.set(cache_key, "".join(chunks))
+    
+    def get_cached_answer(self, model: str, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the answer previously given to an identical user query.
+        
+        Answers are keyed by the raw query rather than the final prompt, so a
+        hit skips paper resolution as well as the model call.
+        
+        Args:
+            model: Model identifier
+            query: User query as submitted
+            
+        Returns:
+            Dict with 'response' and 'paper_info', or None on a miss
+        """
+        cached = self.query_cache.get(self._answer_key(model, query))
+        if cached is None:
+            return None
+        try:
+            return serialization.loads(cached)
+        except ValueError:
+            logger.warning("Discarding unreadable cached answer")
+            return None
+    
+    def cache_answer(self, model: str, query: str, response: str,
+                     paper_info: Dict[str, Any]) -> None:
+        """
+        Remember the answer to a user query for get_cached_answer.
+        
+        Args:
+            model: Model identifier
+            query: User query as submitted
+            response: Model response text
+            paper_info: Paper details shown alongside the response
+        """
+        answer = {'response': response, 'paper_info': paper_info}
+        self.query_cache.set(
+            self._answer_key(model, query), serialization.dumps(answer).decode()
+        )
+    
+    @staticmethod
+    def _cache_key(model: str, prompt: str) -> str:
+        """Build the cache key for a model/prompt pair."""
+        return ResponseCache.make_key(model, prompt)
+    
+    @staticmethod
+    def _answer_key(model: str, query: str) -> str:
+        """Build the cache key for a model/raw query pair."""
+        # Prefixing the model keeps these apart from prompt keys
+        return ResponseCache.make_key(f"answer:{model}", query)
+    
+    def _get_client(self, model: str):
+        """
+        Resolve the configured client for a model.
+        
+        Args:
+            model: Model identifier
+            
+        Returns:
+            Client that serves the model
+            
+        Raises:
+            ModelNotFoundError: If the model or its client is unknown
+            APIError: If the client is not properly configured
+        """
         client_name = self.model_routing.get(model)
         if not client_name:
             available_models = list(self.model_routing.keys())
@@ -137,38 +302,100 @@ class AIService:
         if not client.is_available():
             raise APIError(f"Client '{client_name}' is not properly configured")
         
+        return client
+    
+    def _get_model_response(self, model: str, prompt: str) -> str:
+        """
+        Get response from specific model.
+        
+        Transient failures are retried with exponential backoff unless the
+        client retries them itself, and retrying stops as soon as the
+        client's circuit opens.
+        """
+        client = self._get_client(model)
+        client_name = self.model_routing[model]
+        
+        if self._circuit_open(client_name):
+            raise APIError(
+                f"Client '{client_name}' is skipped after {CIRCUIT_FAIL_MAX} consecutive failures"
+            )
+        
+        attempts = 1 if client.retries_transient_errors else MODEL_RETRY_ATTEMPTS
+        retrying = Retrying(
+            retry=retry_if_exception(
+                lambda e: isinstance(e, TransientAPIError) and not self._circuit_open(client_name)
+            ),
+            wait=_retry_wait,
+            stop=stop_after_attempt(attempts),
+            reraise=True
+        )
+        response = retrying(self._call_client, client, client_name, model, prompt)
+        
+        logger.info("Successfully got response from %s", model)
+        return response
+    
+    def _call_client(self, client, client_name: str, model: str, prompt: str) -> str:
+        """
+        Make one call to a client, updating its circuit state.
+        
+        Only transient failures count towards opening the circuit.
+        """
         try:
             response = client.get_response(model, prompt)
-            logger.info(f"Successfully got response from {model}")
-            return response
             
+        except TransientAPIError as e:
+            self._record_failure(client_name)
+            error_msg = f"Error getting response from {model}: {str(e)}"
+            logger.error(error_msg)
+            raise TransientAPIError(error_msg) from e
         except Exception as e:
             error_msg = f"Error getting response from {model}: {str(e)}"
             logger.error(error_msg)
             raise APIError(error_msg) from e
-    
-    def _add_to_cache(self, key: str, value: str) -> None:
-        """Add item to cache with size limit."""
-        if key in self.query_cache:
-            self.query_cache.pop(key)
-        elif len(self.query_cache) >= self.cache_size:
-            # Remove oldest item
-            self.query_cache.popitem(last=False)
         
-        self.query_cache[key] = value
+        with self._health_lock:
+            self._client_health.pop(client_name, None)
+        return response
+    
+    def _circuit_open(self, client_name: str) -> bool:
+        """Check whether a client is being skipped after repeated failures."""
+        with self._health_lock:
+            health = self._client_health.get(client_name)
+            return (
+                health is not None
+                and health['fails'] >= CIRCUIT_FAIL_MAX
+                and time.monotonic() - health['fail_ts'] < CIRCUIT_RESET_TIMEOUT
+            )
+    
+    def _record_failure(self, client_name: str) -> None:
+        """Count a failed call; the circuit opens at CIRCUIT_FAIL_MAX."""
+        with self._health_lock:
+            health = self._client_health.setdefault(client_name, {'fails': 0, 'fail_ts': 0.0})
+            health['fails'] += 1
+            health['fail_ts'] = time.monotonic()
+            fails = health['fails']
+        if fails == CIRCUIT_FAIL_MAX:
+            logger.warning(
+                "Skipping client %s for %ss after %s consecutive failures",
+                client_name, CIRCUIT_RESET_TIMEOUT, CIRCUIT_FAIL_MAX
+            )
     
     def validate_model(self, model: str) -> bool:
         """Check if a model is available."""
-        return model in self.get_available_models()
+        return model in self.models_info
     
     def get_model_info(self, model: str) -> Dict[str, str]:
         """Get information about a specific model."""
-        if not self.validate_model(model):
+        info = self.models_info.get(model)
+        if info is None:
             return {
                 'status': 'unavailable',
                 'reason': 'Model not configured or client unavailable'
             }
-        
+        return dict(info)
+    
+    def _describe_model(self, model: str) -> Dict[str, str]:
+        """Build the info entry for an available model."""
         client_name = self.model_routing.get(model)
         client = self.clients.get(client_name)
         
@@ -223,5 +450,19 @@ class AIService:
         return {
             'size': len(self.query_cache),
             'max_size': self.cache_size,
-            'hit_rate': getattr(self, '_cache_hits', 0) / max(getattr(self, '_cache_requests', 1), 1)
+            'backend': self.query_cache.backend,
+            'hits': self.query_cache.hits,
+            'lookups': self.query_cache.lookups,
+            'hit_rate': self.query_cache.hit_rate
         }
+
+
+@lru_cache(maxsize=None)
+def get_ai_service() -> AIService:
+    """
+    Get the process-wide AI service.
+    
+    Blueprints share this instance so each worker builds one set of clients
+    and caches instead of one per blueprint.
+    """
+    return AIService()
@@ -0,0 +1,231 @@
+"""
+Response cache for AI model replies.
+
+Replies are keyed by a compact digest of the model and prompt. When a Redis
+server is configured through REDIS_URL the cache is shared by every worker
+process; otherwise an in-process LRU cache is used.
+
+TTLCache is a small in-process cache for expensive status payloads, such as
+health checks, that are polled far more often than they change.
+"""
+
+import os
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 86400
+KEY_PREFIX = 'metafunction:response:'
+
+# Bump when prompt construction or response handling changes so replies
+# cached under the old format are no longer served
+CACHE_VERSION = 1
+
+
+class ResponseCache:
+    """LRU response cache with an optional shared Redis backend."""
+    
+    def __init__(self, max_size: int = 100, ttl: Optional[int] = None,
+                 redis_url: Optional[str] = None):
+        """
+        Initialize response cache.
+        
+        Args:
+            max_size: Maximum number of entries kept in the in-process cache
+            ttl: Seconds a reply stays in Redis (defaults to $CACHE_TTL or one day)
+            redis_url: Redis connection URL (defaults to $REDIS_URL)
+        """
+        self.max_size = max_size
+        self.ttl = ttl if ttl is not None else int(os.getenv('CACHE_TTL', DEFAULT_TTL))
+        self._local = OrderedDict()
+        self._local_lock = threading.Lock()
+        self._redis = self._connect(redis_url or os.getenv('REDIS_URL'))
+        
+        # Lookup counters for hit-rate reporting; approximate under threads
+        self.hits = 0
+        self.lookups = 0
+    
+    @staticmethod
+    def _connect(redis_url: Optional[str]):
+        """Connect to Redis, returning None if it is unavailable."""
+        if not redis_url:
+            return None
+        if redis is None:
+            logger.warning("REDIS_URL is set but the redis package is not installed")
+            return None
+        
+        try:
+            client = redis.Redis.from_url(
+                redis_url, decode_responses=True, socket_timeout=2
+            )
+            client.ping()
+            logger.info("Using Redis response cache")
+            return client
+        except redis.RedisError as e:
+            logger.warning("Redis unavailable, using in-process cache: %s", e)
+            return None
+    
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """
+        Build a fixed-size cache key for a model/prompt pair.
+        
+        Args:
+            model: Model identifier
+            prompt: Input prompt
+        
+        Returns:
+            Hex digest identifying the pair
+        """
+        digest = hashlib.blake2b(
+            f"{CACHE_VERSION}\0{model}\0{prompt}".encode(), digest_size=16
+        )
+        return digest.hexdigest()
+    
+    @property
+    def backend(self) -> str:
+        """Name of the active cache backend."""
+        return 'redis' if self._redis is not None else 'memory'
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached reply.
+        
+        Args:
+            key: Cache key from make_key
+        
+        Returns:
+            Cached reply, or None on a miss
+        """
+        value = self._lookup(key)
+        self.lookups += 1
+        if value is not None:
+            self.hits += 1
+        return value
+    
+    def _lookup(self, key: str) -> Optional[str]:
+        """Read a reply from the active backend."""
+        if self._redis is not None:
+            try:
+                return self._redis.get(KEY_PREFIX + key)
+            except redis.RedisError as e:
+                logger.warning("Redis cache read failed: %s", e)
+        
+        with self._local_lock:
+            value = self._local.get(key)
+            if value is not None:
+                self._local.move_to_end(key)
+            return value
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        return self.hits / self.lookups if self.lookups else 0.0
+    
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a reply in the cache.
+        
+        Args:
+            key: Cache key from make_key
+            value: Reply text
+        """
+        if self._redis is not None:
+            try:
+                self._redis.setex(KEY_PREFIX + key, self.ttl, value)
+                return
+            except redis.RedisError as e:
+                logger.warning("Redis cache write failed: %s", e)
+        
+        with self._local_lock:
+            if key in self._local:
+                self._local.move_to_end(key)
+            elif len(self._local) >= self.max_size:
+                # Remove oldest item
+                self._local.popitem(last=False)
+            self._local[key] = value
+    
+    def clear(self) -> None:
+        """Remove every cached reply."""
+        with self._local_lock:
+            self._local.clear()
+        if self._redis is not None:
+            try:
+                keys = list(self._redis.scan_iter(match=KEY_PREFIX + '*'))
+                if keys:
+                    self._redis.delete(*keys)
+            except redis.RedisError as e:
+                logger.warning("Redis cache clear failed: %s", e)
+    
+    def __len__(self) -> int:
+        """Number of replies held in the in-process cache."""
+        with self._local_lock:
+            return len(self._local)
+
+
+class TTLCache:
+    """In-process cache whose entries expire after a fixed number of seconds."""
+    
+    def __init__(self, ttl: float):
+        """
+        Initialize TTL cache.
+        
+        Args:
+            ttl: Seconds a computed value is served before it is recomputed
+        """
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+    
+    def get_or_set(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, computing it if missing or expired.
+        
+        Concurrent callers for the same key wait for a single computation
+        instead of each running it.
+        
+        Args:
+            key: Cache key
+            compute: Zero-argument callable producing the value
+            
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self._fresh(key)
+        if value is not None:
+            return value
+        
+        with self._locks_guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        
+        with lock:
+            # Another caller may have filled the entry while we waited
+            value = self._fresh(key)
+            if value is not None:
+                return value
+            
+            value = compute()
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            return value
+    
+    def _fresh(self, key: str) -> Any:
+        """Return the entry for key if it has not expired, else None."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+    
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
@@ -4,16 +4,22 @@ Centralized logging service for structured application logging.
 
 import os
 import csv
-import json
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from collections import deque
+from typing import Dict, Any, Iterator, Optional
 
 from app.config import Config
+from app.utils import serialization
 
 logger = logging.getLogger(__name__)
 
+# The metadata log keeps the most recent entries; once it holds twice this
+# many it is compacted back down, so appends stay cheap between compactions
+METADATA_LOG_MAX_ENTRIES = 1000
+
 
 def setup_logging(level=logging.INFO):
     """Configure logging for the application."""
@@ -45,7 +51,15 @@ class LoggingService:
         
         # Log file paths
         self.chat_log_file = self.log_dir / 'chat_logs.csv'
-        self.metadata_log_file = self.log_dir / 'metadata_log.json'
+        self.metadata_log_file = self.log_dir / 'metadata_log.jsonl'
+        self._migrate_metadata_log(self.log_dir / 'metadata_log.json')
+        self._metadata_log_lock = threading.Lock()
+        self._metadata_log_count = None
+        
+        # Chat log rows go through one long-lived, line-buffered handle
+        self._chat_log_lock = threading.Lock()
+        self._chat_log_handle = None
+        self._chat_log_writer = None
         
         # Initialize CSV file with headers if it doesn't exist
         self._init_chat_log()
@@ -61,6 +75,39 @@ class LoggingService:
                     'response_length', 'error'
                 ])
     
+    def _migrate_metadata_log(self, legacy_file: Path):
+        """Convert a legacy JSON array metadata log to JSON Lines once."""
+        if self.metadata_log_file.exists() or not legacy_file.exists():
+            return
+        
+        try:
+            with open(legacy_file, 'rb') as f:
+                entries = serialization.loads(f.read())
+            with open(self.metadata_log_file, 'wb') as f:
+                for entry in entries:
+                    f.write(serialization.dumps(entry) + b'\n')
+            legacy_file.rename(legacy_file.with_suffix('.json.migrated'))
+            logger.info("Migrated %d metadata entries to %s", len(entries), self.metadata_log_file)
+        except Exception as e:
+            logger.error("Failed to migrate metadata log: %s", e)
+    
+    def _get_chat_log_writer(self):
+        """Get the CSV writer for the chat log, opening the file on first use."""
+        if self._chat_log_handle is None or self._chat_log_handle.closed:
+            self._chat_log_handle = open(
+                self.chat_log_file, 'a', newline='', encoding='utf-8', buffering=1
+            )
+            self._chat_log_writer = csv.writer(self._chat_log_handle)
+        return self._chat_log_writer
+    
+    def close(self):
+        """Close the chat log file handle."""
+        with self._chat_log_lock:
+            if self._chat_log_handle is not None:
+                self._chat_log_handle.close()
+                self._chat_log_handle = None
+                self._chat_log_writer = None
+    
     def log_chat(self, session_id: str, user_input: str, response: str,
                  paper_info: Dict[str, Any], model: str, error: Optional[str] = None):
         """
@@ -86,10 +133,9 @@ class LoggingService:
             # Calculate response length
             response_length = len(response) if response else 0
             
-            # Write to CSV log
-            with open(self.chat_log_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
+            # Append to the CSV log through the shared handle
+            with self._chat_log_lock:
+                self._get_chat_log_writer().writerow([
                     timestamp, session_id, user_input, model,
                     paper_title, paper_doi, paper_pmid, has_full_text,
                     response_length, error or ''
@@ -102,46 +148,59 @@ class LoggingService:
     
     def log_metadata(self, session_id: str, metadata: Dict[str, Any]):
         """
-        Log paper metadata to JSON file.
+        Log paper metadata to the JSON Lines metadata log.
+        
+        Entries are appended one per line, so logging cost does not grow
+        with the size of the log. Retention is bounded: when the log reaches
+        twice METADATA_LOG_MAX_ENTRIES it is rewritten to keep only the last
+        METADATA_LOG_MAX_ENTRIES entries.
         
         Args:
             session_id: User session identifier
             metadata: Paper metadata dictionary
         """
         try:
-            timestamp = datetime.now().isoformat()
-            
-            # Load existing metadata log or create new one
-            metadata_log = []
-            if self.metadata_log_file.exists():
-                try:
-                    with open(self.metadata_log_file, 'r', encoding='utf-8') as f:
-                        metadata_log = json.load(f)
-                except json.JSONDecodeError:
-                    logger.warning("Corrupted metadata log file, starting fresh")
-                    metadata_log = []
-            
-            # Add new entry
             log_entry = {
-                'timestamp': timestamp,
+                'timestamp': datetime.now().isoformat(),
                 'session_id': session_id,
                 'metadata': metadata
             }
-            metadata_log.append(log_entry)
-            
-            # Keep only last 1000 entries to prevent file from growing too large
-            if len(metadata_log) > 1000:
-                metadata_log = metadata_log[-1000:]
             
-            # Write back to file
-            with open(self.metadata_log_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata_log, f, indent=2, ensure_ascii=False)
+            with self._metadata_log_lock:
+                if self._metadata_log_count is None:
+                    self._metadata_log_count = self._count_metadata_log_lines()
+                
+                with open(self.metadata_log_file, 'ab') as f:
+                    f.write(serialization.dumps(log_entry) + b'\n')
+                self._metadata_log_count += 1
+                
+                if self._metadata_log_count >= 2 * METADATA_LOG_MAX_ENTRIES:
+                    self._compact_metadata_log()
             
             logger.info(f"Metadata logged for session {session_id}")
             
         except Exception as e:
             logger.error(f"Failed to log metadata: {e}")
     
+    def _count_metadata_log_lines(self) -> int:
+        """Count the entries currently in the metadata log."""
+        if not self.metadata_log_file.exists():
+            return 0
+        with open(self.metadata_log_file, 'rb') as f:
+            return sum(1 for _ in f)
+    
+    def _compact_metadata_log(self):
+        """Rewrite the metadata log to its last METADATA_LOG_MAX_ENTRIES lines."""
+        with open(self.metadata_log_file, 'rb') as f:
+            lines = deque(f, maxlen=METADATA_LOG_MAX_ENTRIES)
+        
+        # Replace atomically so readers never see a partial file
+        tmp_file = self.metadata_log_file.with_suffix('.jsonl.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.writelines(lines)
+        os.replace(tmp_file, self.metadata_log_file)
+        self._metadata_log_count = len(lines)
+    
     def get_recent_chats(self, limit: int = 100) -> list[Dict[str, Any]]:
         """
         Get recent chat interactions.
@@ -152,25 +211,24 @@ class LoggingService:
         Returns:
             List of chat dictionaries
         """
-        chats = []
         try:
             if self.chat_log_file.exists():
-                with open(self.chat_log_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    chats = list(reader)
-                    
-                # Return most recent chats
-                return chats[-limit:]
+                with open(self.chat_log_file, 'r', encoding='utf-8', newline='') as f:
+                    # Keep only the tail while parsing, not the whole log
+                    return list(deque(csv.DictReader(f), maxlen=limit))
                 
         except Exception as e:
             logger.error(f"Failed to read chat log: {e}")
         
-        return chats
+        return []
     
     def get_usage_stats(self) -> Dict[str, Any]:
         """
         Get usage statistics from logs.
         
+        The chat log is aggregated in a single pass while it is read, so no
+        rows are held in memory.
+        
         Returns:
             Dictionary containing usage statistics
         """
@@ -182,26 +240,27 @@ class LoggingService:
         }
         
         try:
-            chats = self.get_recent_chats(limit=10000)  # Get more for stats
-            
-            stats['total_chats'] = len(chats)
+            if not self.chat_log_file.exists():
+                return stats
             
-            if chats:
-                # Count model usage
-                for chat in chats:
+            successful_chats = 0
+            with open(self.chat_log_file, 'r', encoding='utf-8', newline='') as f:
+                for chat in csv.DictReader(f):
+                    stats['total_chats'] += 1
+                    
                     model = chat.get('model', 'unknown')
                     stats['models_used'][model] = stats['models_used'].get(model, 0) + 1
-                
-                # Count papers with DOI/PMID
-                papers_with_ids = sum(
-                    1 for chat in chats 
-                    if chat.get('paper_doi') or chat.get('paper_pmid')
-                )
-                stats['papers_processed'] = papers_with_ids
-                
-                # Calculate success rate (chats without errors)
-                successful_chats = sum(1 for chat in chats if not chat.get('error'))
-                stats['success_rate'] = successful_chats / len(chats) * 100
+                    
+                    # Count papers with DOI/PMID
+                    if chat.get('paper_doi') or chat.get('paper_pmid'):
+                        stats['papers_processed'] += 1
+                    
+                    # Chats without errors count as successful
+                    if not chat.get('error'):
+                        successful_chats += 1
+            
+            if stats['total_chats']:
+                stats['success_rate'] = successful_chats / stats['total_chats'] * 100
             
         except Exception as e:
             logger.error(f"Failed to calculate usage stats: {e}")
@@ -216,17 +275,51 @@ class LoggingService:
         """Get the path to the metadata log file."""
         return self.metadata_log_file
     
-    def get_metadata_entries(self) -> list[Dict[str, Any]]:
-        """Get all metadata entries."""
+    def _iter_metadata_log(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over raw metadata log entries, skipping corrupt lines."""
+        if not self.metadata_log_file.exists():
+            return
+        
+        with open(self.metadata_log_file, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield serialization.loads(line)
+                except ValueError:
+                    logger.warning("Skipping corrupted metadata log line")
+    
+    def get_metadata_entries(self, limit: int = 1000) -> list[Dict[str, Any]]:
+        """
+        Get the most recent metadata entries.
+        
+        Args:
+            limit: Maximum number of entries to return
+            
+        Returns:
+            List of log entries with 'timestamp', 'session_id' and the
+            paper 'metadata' dictionary
+        """
         try:
-            if self.metadata_log_file.exists():
-                with open(self.metadata_log_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return [entry.get('metadata', {}) for entry in data]
+            return list(deque(self._iter_metadata_log(), maxlen=limit))
         except Exception as e:
             logger.error(f"Failed to read metadata entries: {e}")
         return []
     
+    def iter_metadata_json(self) -> Iterator[bytes]:
+        """
+        Stream the metadata log as a single JSON array.
+        
+        Yields:
+            Chunks of the JSON document
+        """
+        yield b'['
+        first = True
+        for entry in self._iter_metadata_log():
+            yield (b'' if first else b',') + serialization.dumps(entry)
+            first = False
+        yield b']'
+    
     def get_current_timestamp(self) -> str:
         """Get current timestamp in ISO format."""
         return datetime.now().isoformat()
@@ -5,14 +5,22 @@ This service handles paper identification, full-text resolution, and metadata
 extraction from various academic sources.
 """
 
+import re
 import logging
+import threading
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from app.services.cache_service import TTLCache
 
 # Import resolvers from the utils directory (will be migrated to resolvers/)
 from resolvers.full_text_resolver import (
     resolve_full_text,
+    fetch_bibliographic_metadata,
+    clean_doi,
     extract_pmid_from_query,
     extract_doi_from_query,
     search_paper_by_title,
@@ -22,6 +30,38 @@ from resolvers.full_text_resolver import (
 
 logger = logging.getLogger(__name__)
 
+# Seconds a health check result is reused; probes poll far more often and
+# each check resolves a real paper
+HEALTH_CHECK_TTL = 15
+
+# Seconds a probe waits for the check before reporting unhealthy, so a hung
+# upstream cannot stall liveness checks
+HEALTH_CHECK_TIMEOUT = 10
+
+# Patterns used to pull a paper title out of a free-form query
+TITLE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'titled "([^"]+)"',
+        r'titled: ([^\.]+)',
+        r'publication ([^\.]+)',
+        r'paper ([^\.]+)',
+        r'article ([^\.]+)',
+        r'titled (?!.*doi)([^\.]+)',
+    )
+)
+
+# Questions about bibliographic details, answerable without the paper body
+METADATA_QUESTION_PATTERN = re.compile(
+    r"\b(journal|authors?|published|publication date|year|citation|cite|volume|issue)\b",
+    re.IGNORECASE
+)
+CONTENT_QUESTION_PATTERN = re.compile(
+    r"\b(summar\w*|method\w*|results?|finding\w*|conclu\w*|abstract|explain|"
+    r"discuss\w*|data\w*|analy\w*|figures?|tables?)\b",
+    re.IGNORECASE
+)
+
 @dataclass
 class PaperResult:
     """Container for paper resolution results."""
@@ -89,6 +129,12 @@ class PaperService:
             max_text_length: Maximum length of text to include in prompts
         """
         self.max_text_length = max_text_length
+        self._health_cache = TTLCache(ttl=HEALTH_CHECK_TTL)
+        self._health_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='paper-health'
+        )
+        self._health_future = None
+        self._health_lock = threading.Lock()
     
     def process_query(self, query: str) -> PaperResult:
         """
@@ -100,7 +146,7 @@ class PaperService:
         Returns:
             PaperResult with resolved paper information
         """
-        logger.info(f"Processing query: {query[:100]}...")
+        logger.info("Processing query: %.100s...", query)
         
         # Initialize result
         result = PaperResult()
@@ -110,17 +156,17 @@ class PaperService:
         pmid = extract_pmid_from_query(query)
         
         if doi:
-            logger.info(f"Found DOI in query: {doi}")
+            logger.info("Found DOI in query: %s", doi)
             result.doi = doi
         if pmid:
-            logger.info(f"Found PMID in query: {pmid}")
+            logger.info("Found PMID in query: %s", pmid)
             result.pmid = pmid
         
         # If no identifiers found, try to find paper by title
         if not (doi or pmid) and len(query) > 20:
             title = self._extract_title_from_query(query)
             if title:
-                logger.info(f"Attempting to find paper with title: {title}")
+                logger.info("Attempting to find paper with title: %s", title)
                 found_doi, found_pmid = search_paper_by_title(title)
                 if found_doi or found_pmid:
                     result.doi = found_doi or result.doi
@@ -133,6 +179,57 @@ class PaperService:
         
         return result
     
+    def lookup_metadata(self, query: str) -> PaperResult:
+        """
+        Look up only the bibliographic record of the paper a query identifies.
+        
+        Unlike process_query this makes a single metadata request and never
+        resolves the paper text.
+        
+        Args:
+            query: User input query containing a DOI or PMID
+            
+        Returns:
+            PaperResult with identifiers and citation details
+        """
+        result = PaperResult(
+            doi=extract_doi_from_query(query) or "",
+            pmid=extract_pmid_from_query(query) or ""
+        )
+        
+        metadata = fetch_bibliographic_metadata(pmid=result.pmid, doi=result.doi)
+        if metadata:
+            result.title = metadata['title']
+            result.authors = metadata['authors']
+            result.journal = metadata['journal']
+            result.year = str(metadata['year'])
+            result.doi = metadata['doi'] or result.doi
+            result.pmid = metadata['pmid'] or result.pmid
+            result.source = "Europe PMC"
+            result.access_status = "Metadata Only"
+        
+        return result
+    
+    def is_metadata_only_query(self, query: str) -> bool:
+        """
+        Check whether a query identifies a paper but only asks about its metadata.
+        
+        Such questions (e.g. "what journal is this in?") do not need the
+        paper text, so the model can be queried without waiting for it.
+        
+        Args:
+            query: User input query
+            
+        Returns:
+            True if the query has an identifier and only asks about metadata
+        """
+        if not (extract_doi_from_query(query) or extract_pmid_from_query(query)):
+            return False
+        return bool(
+            METADATA_QUESTION_PATTERN.search(query)
+            and not CONTENT_QUESTION_PATTERN.search(query)
+        )
+    
     def resolve_paper(self, doi: str = None, pmid: str = None, 
                      title: str = None, pmcid: str = None) -> PaperResult:
         """
@@ -147,7 +244,7 @@ class PaperService:
         Returns:
             PaperResult with resolved information
         """
-        result = PaperResult(doi=doi or "", pmid=pmid or "", 
+        result = PaperResult(doi=clean_doi(doi) if doi else "", pmid=pmid or "", 
                            title=title or "", pmcid=pmcid or "")
         
         # If title provided but no identifiers, try to find them
@@ -164,19 +261,8 @@ class PaperService:
     
     def _extract_title_from_query(self, query: str) -> Optional[str]:
         """Extract potential paper title from query."""
-        import re
-        
-        title_patterns = [
-            r'titled "([^"]+)"',
-            r'titled: ([^\.]+)',
-            r'publication ([^\.]+)',
-            r'paper ([^\.]+)',
-            r'article ([^\.]+)',
-            r'titled (?!.*doi)([^\.]+)',
-        ]
-        
-        for pattern in title_patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
+        for pattern in TITLE_PATTERNS:
+            match = pattern.search(query)
             if match:
                 potential_title = (
                     match.group(1)
@@ -195,7 +281,7 @@ class PaperService:
     def _resolve_paper_content(self, result: PaperResult) -> None:
         """Resolve full text and metadata for a paper."""
         try:
-            logger.info(f"Resolving content for DOI: {result.doi}, PMID: {result.pmid}")
+            logger.info("Resolving content for DOI: %s, PMID: %s", result.doi, result.pmid)
             
             # Use the existing resolver
             resolution_result = resolve_full_text(
@@ -204,8 +290,10 @@ class PaperService:
                 title=result.title if result.title else None
             )
             
-            full_text = resolution_result.get('text') if resolution_result else None
             metadata = resolution_result if resolution_result else {}
+            # Take the text out of the resolver result so only the truncated
+            # copy outlives this method
+            full_text = metadata.pop('text', None) if isinstance(metadata, dict) else None
             
             if full_text:
                 # Determine if it's full text or abstract
@@ -213,15 +301,17 @@ class PaperService:
                 result.has_abstract = bool(full_text) and not result.has_full_text
                 
                 # Truncate if necessary
-                if len(full_text) > self.max_text_length:
-                    result.full_text = full_text[:self.max_text_length] + "...[truncated]"
-                    result.text_length = len(full_text)
+                result.text_length = len(full_text)
+                if result.text_length > self.max_text_length:
+                    text = full_text[:self.max_text_length] + "...[truncated]"
                 else:
-                    if result.has_full_text:
-                        result.full_text = full_text
-                    else:
-                        result.abstract = full_text
-                    result.text_length = len(full_text)
+                    text = full_text
+                del full_text
+                
+                if result.has_full_text:
+                    result.full_text = text
+                else:
+                    result.abstract = text
                 
                 # Set access status
                 if result.has_full_text:
@@ -253,6 +343,9 @@ class PaperService:
         """
         Build an enhanced prompt with paper context.
         
+        Changing the prompt layout should be paired with bumping
+        cache_service.CACHE_VERSION so stale cached replies are dropped.
+        
         Args:
             original_query: Original user query
             paper_result: Resolved paper information
@@ -263,15 +356,50 @@ class PaperService:
         if not paper_result.has_content:
             return original_query
         
-        context_parts = []
+        # Collect the pieces and join them once, so the paper text is
+        # copied into the prompt exactly once
+        parts = ["I'd like you to analyze this scientific paper:\n\n"]
         
         # Add paper content
         primary_text = paper_result.primary_text
         if primary_text:
             content_type = "Full text" if paper_result.has_full_text else "Abstract"
-            context_parts.append(f"{content_type} of the paper:\n{primary_text}")
+            parts.extend((content_type, " of the paper:\n", primary_text, "\n\n"))
         
         # Add metadata
+        metadata_lines = self._metadata_lines(paper_result)
+        if metadata_lines:
+            parts.extend(("Paper metadata:\n", "\n".join(metadata_lines), "\n\n"))
+        
+        parts.extend(("Based on this paper, please answer the following question: ", original_query))
+        
+        return "".join(parts)
+    
+    def build_metadata_prompt(self, original_query: str, paper_result: PaperResult) -> str:
+        """
+        Build a prompt carrying only a paper's bibliographic record.
+        
+        Args:
+            original_query: Original user query
+            paper_result: Result from lookup_metadata
+            
+        Returns:
+            Prompt with the citation details, or the query if none were found
+        """
+        metadata_lines = self._metadata_lines(paper_result)
+        if not (paper_result.title or paper_result.journal):
+            return original_query
+        
+        return "".join((
+            "Bibliographic record of the paper in question:\n",
+            "\n".join(metadata_lines),
+            "\n\nUsing this record, please answer the following question: ",
+            original_query
+        ))
+    
+    @staticmethod
+    def _metadata_lines(paper_result: PaperResult) -> List[str]:
+        """Format the citation details of a paper, one per line."""
         metadata_lines = []
         if paper_result.title:
             metadata_lines.append(f"Title: {paper_result.title}")
@@ -283,19 +411,7 @@ class PaperService:
             metadata_lines.append(f"Year: {paper_result.year}")
         if paper_result.doi:
             metadata_lines.append(f"DOI: {paper_result.doi}")
-        
-        if metadata_lines:
-            context_parts.append("Paper metadata:\n" + "\n".join(metadata_lines))
-        
-        # Build final prompt
-        enhanced_prompt = (
-            f"I'd like you to analyze this scientific paper:\n\n"
-            + "\n\n".join(context_parts)
-            + "\n\n"
-            + f"Based on this paper, please answer the following question: {original_query}"
-        )
-        
-        return enhanced_prompt
+        return metadata_lines
     
     def test_all_sources(self, doi: Optional[str] = None, pmid: Optional[str] = None, 
                         title: Optional[str] = None, pmcid: Optional[str] = None) -> Dict[str, Any]:
@@ -311,8 +427,6 @@ class PaperService:
         Returns:
             Dictionary containing test results for each source
         """
-        results = {}
-        
         # Test different resolvers
         test_cases = [
             ("DOI Resolver", lambda: self._test_doi_resolver(doi) if doi else None),
@@ -321,27 +435,39 @@ class PaperService:
             ("Enhanced Resolver", lambda: self._test_enhanced_resolver(doi, pmid, title))
         ]
         
-        for test_name, test_func in test_cases:
-            try:
-                result = test_func()
-                if result is not None:
-                    results[test_name] = {
-                        "status": "success" if result.has_content else "no_content",
-                        "title": result.title,
-                        "doi": result.doi,
-                        "pmid": result.pmid,
-                        "has_full_text": result.has_full_text,
-                        "text_length": result.text_length,
-                        "source": result.source,
-                        "access_logs": result.access_logs
-                    }
-                else:
-                    results[test_name] = {"status": "skipped", "reason": "No input provided"}
-            except Exception as e:
-                results[test_name] = {"status": "error", "error": str(e)}
+        # Each resolver is network-bound, so probe them concurrently; the
+        # total wait is the slowest source rather than the sum of all of them
+        with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+            outcomes = executor.map(
+                self._run_source_test, [test_func for _, test_func in test_cases]
+            )
+            results = {
+                test_name: outcome
+                for (test_name, _), outcome in zip(test_cases, outcomes)
+            }
         
         return results
     
+    @staticmethod
+    def _run_source_test(test_func) -> Dict[str, Any]:
+        """Run a single source test and summarize its outcome."""
+        try:
+            result = test_func()
+            if result is None:
+                return {"status": "skipped", "reason": "No input provided"}
+            return {
+                "status": "success" if result.has_content else "no_content",
+                "title": result.title,
+                "doi": result.doi,
+                "pmid": result.pmid,
+                "has_full_text": result.has_full_text,
+                "text_length": result.text_length,
+                "source": result.source,
+                "access_logs": result.access_logs
+            }
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+    
     def _test_doi_resolver(self, doi: str) -> Optional[PaperResult]:
         """Test DOI-based resolution."""
         if not doi:
@@ -369,9 +495,34 @@ class PaperService:
         """
         Perform health check on paper resolution services.
         
+        The result is reused for HEALTH_CHECK_TTL seconds so frequent probes
+        do not each trigger a full paper resolution. Only one check runs at
+        a time: while it is in flight, probes wait on it rather than queueing
+        another. A check that takes longer than HEALTH_CHECK_TIMEOUT is
+        reported as degraded; it keeps running in the background and fills
+        the cache for later probes.
+        
         Returns:
             Dictionary containing health status
         """
+        with self._health_lock:
+            if self._health_future is None or self._health_future.done():
+                self._health_future = self._health_executor.submit(
+                    self._health_cache.get_or_set, 'health', self._run_health_check
+                )
+            future = self._health_future
+        
+        try:
+            return future.result(timeout=HEALTH_CHECK_TIMEOUT)
+        except FutureTimeoutError:
+            logger.warning("Paper health check still running after %ss", HEALTH_CHECK_TIMEOUT)
+            return {
+                'overall_status': 'degraded',
+                'error': f"Health check timed out after {HEALTH_CHECK_TIMEOUT}s"
+            }
+    
+    def _run_health_check(self) -> Dict[str, Any]:
+        """Run the paper resolution health check."""
         health_status = {
             'overall_status': 'healthy',
             'resolvers': {},
@@ -397,3 +548,15 @@ class PaperService:
             health_status['error'] = str(e)
         
         return health_status
+
+
+@lru_cache(maxsize=None)
+def get_paper_service() -> PaperService:
+    """
+    Get the process-wide paper service.
+    
+    Blueprints share this instance so each worker keeps one cached health
+    check result and one health check thread, and the web and API routes
+    resolve papers with the same max_text_length setting.
+    """
+    return PaperService()
@@ -6,6 +6,7 @@ from .exceptions import (
     MetaFunctionError,
     ModelNotFoundError,
     APIError,
+    TransientAPIError,
     ConfigurationError,
     PaperResolutionError,
     ValidationError
@@ -15,6 +16,7 @@ __all__ = [
     'MetaFunctionError',
     'ModelNotFoundError',
     'APIError', 
+    'TransientAPIError',
     'ConfigurationError',
     'PaperResolutionError',
     'ValidationError'
@@ -23,6 +23,11 @@ class APIError(MetaFunctionError):
     pass
 
 
+class TransientAPIError(APIError):
+    """Raised when an external API call fails in a way worth retrying."""
+    pass
+
+
 class ConfigurationError(MetaFunctionError):
     """Raised when configuration is invalid or missing."""
     pass
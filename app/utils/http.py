@@ -0,0 +1,108 @@
+"""
+Shared HTTP utilities for outbound connections.
+"""
+
+import os
+import ssl
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connection pool sizing for the shared session
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+
+def _ca_bundle_path() -> str:
+    """Get the CA bundle path, preferring SSL_CERT_FILE over certifi."""
+    cafile = os.getenv('SSL_CERT_FILE')
+    if not cafile:
+        import certifi
+        cafile = certifi.where()
+    return cafile
+
+
+@lru_cache(maxsize=1)
+def get_ssl_context() -> ssl.SSLContext:
+    """
+    Get the process-wide verified SSL context.
+    
+    The context is built once from SSL_CERT_FILE, falling back to the
+    certifi CA bundle, and reused for every outbound HTTPS connection.
+    
+    Returns:
+        Verified SSL context
+    """
+    return ssl.create_default_context(cafile=_ca_bundle_path())
+
+
+class SSLContextAdapter(HTTPAdapter):
+    """HTTP adapter that verifies HTTPS with the shared SSL context."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = get_ssl_context()
+        super().init_poolmanager(*args, **kwargs)
+    
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs['ssl_context'] = get_ssl_context()
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+    
+    def cert_verify(self, conn, url, verify, cert):
+        # The shared context already trusts the CA bundle; passing the bundle
+        # path as well would reload it into the context on every connection
+        if verify is True and url.lower().startswith('https'):
+            conn.cert_reqs = 'CERT_REQUIRED'
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+            return
+        super().cert_verify(conn, url, verify, cert)
+
+
+def create_session(retries: Retry, pool_connections: int = POOL_CONNECTIONS,
+                   pool_maxsize: int = POOL_MAXSIZE) -> requests.Session:
+    """
+    Create a pooled HTTP session verified with the shared SSL context.
+    
+    Args:
+        retries: urllib3 retry policy applied to every request
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum connections kept alive per host
+        
+    Returns:
+        New requests session
+    """
+    adapter = SSLContextAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retries
+    )
+    
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """
+    Get the process-wide pooled HTTP session.
+    
+    Reusing one session keeps connections alive between calls, so repeated
+    requests to the same host skip the TCP and TLS handshakes. HTTPS is
+    verified with the shared SSL context, so its TLS session cache is
+    reused across connections. Idempotent requests are retried on
+    connection errors and on 429/502/503/504.
+    
+    Returns:
+        Shared requests session
+    """
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 502, 503, 504),
+        raise_on_status=False
+    )
+    return create_session(retries)
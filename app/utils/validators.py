@@ -5,9 +5,12 @@ This module provides functions for validating request data and ensuring
 data integrity across the application.
 """
 
+import re
 from typing import Dict, Any, Set, Optional
 from app.utils.exceptions import ValidationError
 
+SESSION_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+
 
 def validate_request_data(data: Dict[str, Any], required_fields: Set[str], 
                          optional_fields: Optional[Set[str]] = None) -> None:
@@ -146,8 +149,7 @@ def validate_session_id(session_id: str) -> None:
         raise ValidationError("Session ID must be between 8 and 128 characters")
     
     # Check for valid characters (alphanumeric, hyphens, underscores)
-    import re
-    if not re.match(r'^[a-zA-Z0-9_-]+$', session_id):
+    if not SESSION_ID_PATTERN.match(session_id):
         raise ValidationError("Session ID can only contain letters, numbers, hyphens, and underscores")
 
 
@@ -6,8 +6,6 @@ import requests
 import io
 import base64
 import re
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -17,6 +15,7 @@ from bs4 import BeautifulSoup
 
 # Reuse your existing PDF extraction methods
 from resolvers.pdf_extractor import extract_text_from_pdf_bytes
+from resolvers.browser_pool import get_browser_pool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -40,63 +39,8 @@ def extract_pdf_with_browser(url, timeout=60):
     logging.info(f"Created temporary directory at {temp_dir}")
 
     try:
-        # Check if Selenium is installed
-        try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            from selenium.webdriver.chrome.service import Service
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-        except ImportError:
-            logging.error("Selenium not installed. Install with: pip install selenium")
-            return None
-
-        # Try to use webdriver-manager for ChromeDriver installation
-        try:
-            from webdriver_manager.chrome import ChromeDriverManager
-
-            chromedriver_path = ChromeDriverManager().install()
-        except ImportError:
-            logging.warning(
-                "webdriver-manager not installed, using system ChromeDriver"
-            )
-            chromedriver_path = None
-
-        # Configure Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")  # Run in headless mode
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-
-        # Add user agent to appear as a real browser
-        chrome_options.add_argument(
-            "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.131 Safari/537.36"
-        )
-
-        # Configure download settings
-        prefs = {
-            "download.default_directory": temp_dir,
-            "download.prompt_for_download": False,
-            "download.directory_upgrade": True,
-            "plugins.always_open_pdf_externally": True,
-            "pdfjs.disabled": True,  # Disable built-in PDF viewer
-        }
-        chrome_options.add_experimental_option("prefs", prefs)
-
-        # Initialize Chrome driver
-        if chromedriver_path:
-            service = Service(chromedriver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        else:
-            driver = webdriver.Chrome(options=chrome_options)
-
-        logging.info("Chrome WebDriver initialized")
-
-        try:
+        # Reuse a warm driver; launching Chrome per call costs seconds
+        with get_browser_pool().acquire(download_dir=temp_dir) as driver:
             # Handle specific domains with special procedures
             domain = urlparse(url).netloc.lower()
 
@@ -105,10 +49,6 @@ def extract_pdf_with_browser(url, timeout=60):
             else:
                 return _generic_pdf_extraction(driver, url, temp_dir, timeout)
 
-        finally:
-            driver.quit()
-            logging.info("WebDriver closed")
-
     except Exception as e:
         logging.error(f"Browser PDF extraction error: {str(e)}")
         return None
@@ -440,7 +380,7 @@ def extract_aacr_html_text(doi):
                 logging.info(f"Trying AACR URL: {url}")
                 response = session.get(url, headers=headers, timeout=30)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, "html.parser")
+                    soup = BeautifulSoup(response.text, "lxml")
 
                     # Try multiple selectors for article content
                     for selector in [
@@ -0,0 +1,233 @@
+"""
+Pool of reusable headless Chrome drivers.
+
+Launching Chrome costs several seconds per call, so drivers are started
+lazily, handed out one request at a time and returned to the pool instead
+of being quit. Each process (e.g. each gunicorn worker) builds its own pool
+on first use, since drivers cannot be shared across a fork.
+"""
+
+import os
+import time
+import queue
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+DEFAULT_POOL_SIZE = 2
+CHECKOUT_TIMEOUT = 120
+
+# Approximate resident memory of one headless Chrome
+BROWSER_MEMORY_BYTES = 500 * 1024 * 1024
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/92.0.4515.131 Safari/537.36"
+)
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def _default_pool_size():
+    """
+    Choose how many drivers a process may keep alive.
+
+    Honors $BROWSER_POOL_SIZE, otherwise keeps to DEFAULT_POOL_SIZE but never
+    more browsers than there are CPUs or than fit in physical memory.
+
+    Returns:
+        Maximum number of concurrent drivers
+    """
+    configured = os.getenv("BROWSER_POOL_SIZE")
+    if configured:
+        return max(1, int(configured))
+
+    size = min(DEFAULT_POOL_SIZE, os.cpu_count() or 1)
+    try:
+        memory = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+        size = min(size, memory // BROWSER_MEMORY_BYTES)
+    except (AttributeError, ValueError, OSError):
+        pass
+    return max(1, size)
+
+
+def _chrome_options():
+    """Build the options shared by every pooled driver."""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+
+    # Save PDFs instead of opening them in the built-in viewer; the download
+    # directory itself is set per checkout
+    chrome_options.add_experimental_option(
+        "prefs",
+        {
+            "download.prompt_for_download": False,
+            "download.directory_upgrade": True,
+            "plugins.always_open_pdf_externally": True,
+            "pdfjs.disabled": True,
+        },
+    )
+    return chrome_options
+
+
+class BrowserPool:
+    """Fixed-size pool of headless Chrome drivers."""
+
+    def __init__(self, size=None):
+        """
+        Initialize the pool.
+
+        Args:
+            size: Maximum number of drivers kept alive at once (defaults to
+                a value sized to this machine's CPUs and memory)
+        """
+        self.size = size or _default_pool_size()
+        self._idle = []
+        self._created = 0
+        # Signalled whenever a driver is returned or a slot is freed
+        self._available = threading.Condition()
+
+    def _launch(self):
+        """Start a new Chrome driver."""
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            service = Service(ChromeDriverManager().install())
+        except ImportError:
+            logging.warning("webdriver-manager not installed, using system ChromeDriver")
+            service = None
+
+        if service:
+            driver = webdriver.Chrome(service=service, options=_chrome_options())
+        else:
+            driver = webdriver.Chrome(options=_chrome_options())
+
+        logging.info("Chrome WebDriver initialized")
+        return driver
+
+    @contextmanager
+    def acquire(self, download_dir=None, timeout=CHECKOUT_TIMEOUT):
+        """
+        Check out a driver for the duration of a with block.
+
+        Args:
+            download_dir: Directory that downloads should be saved to
+            timeout: Seconds to wait for a driver when all are busy
+
+        Yields:
+            Chrome WebDriver
+
+        Raises:
+            queue.Empty: If no driver became free within the timeout
+        """
+        driver = self._checkout(timeout)
+        healthy = True
+
+        try:
+            if download_dir:
+                driver.execute_cdp_cmd(
+                    "Browser.setDownloadBehavior",
+                    {"behavior": "allow", "downloadPath": download_dir},
+                )
+            yield driver
+        except WebDriverException:
+            healthy = False
+            raise
+        finally:
+            self._checkin(driver, healthy)
+
+    def _checkout(self, timeout):
+        """
+        Take an idle driver, launching one if the pool is not full.
+
+        Waiting callers wake up both when a driver is returned and when a
+        broken one is discarded, since either lets them proceed.
+        """
+        deadline = time.monotonic() + timeout
+        with self._available:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise queue.Empty
+                self._available.wait(remaining)
+
+        try:
+            return self._launch()
+        except Exception:
+            self._free_slot()
+            raise
+
+    def _checkin(self, driver, healthy):
+        """Reset a driver and return it to the pool, or discard it if broken."""
+        if healthy:
+            try:
+                # Don't leak one paper's publisher session into the next
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                driver.get("about:blank")
+            except WebDriverException as e:
+                logging.warning(f"Discarding browser that failed to reset: {e}")
+                healthy = False
+
+        if healthy:
+            with self._available:
+                self._idle.append(driver)
+                self._available.notify()
+        else:
+            self._discard(driver)
+
+    def _discard(self, driver):
+        """Quit a driver and free its slot."""
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"Error closing WebDriver: {e}")
+        self._free_slot()
+
+    def _free_slot(self):
+        """Release a driver slot and wake one waiting caller."""
+        with self._available:
+            self._created -= 1
+            self._available.notify()
+
+    def close(self):
+        """Quit every idle driver."""
+        with self._available:
+            drivers, self._idle = self._idle, []
+        for driver in drivers:
+            self._discard(driver)
+
+
+def get_browser_pool():
+    """
+    Return this process's browser pool, creating it on first use.
+
+    Returns:
+        BrowserPool shared by all threads in the current process
+    """
+    global _pool, _pool_pid
+
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = BrowserPool()
+            _pool_pid = os.getpid()
+            atexit.register(_pool.close)
+        return _pool
@@ -2,23 +2,18 @@
 import os
 import re
 import logging
-import requests
-from requests.exceptions import RequestException, ConnectionError
 from Bio import Entrez
 from bs4 import BeautifulSoup
+import lxml.html
 from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import io
-import functools  # Add this line at the top with other imports
-import random
-import time
-import logging
-import requests
 import xml.etree.ElementTree as ET  # Add this import at the top of your file with other imports
 
 # Import PDF extraction functions
 from resolvers.pdf_extractor import extract_text_from_pdf_bytes
+from app.utils.http import get_session
 
 # ... rest of your imports ...
 
@@ -43,6 +38,19 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+# Precompiled patterns for identifier validation and text cleanup
+PMID_PATTERN = re.compile(r"^\d{7,9}$")
+DOI_PATTERN = re.compile(r"^10\.\d{4,9}/[-._;()/:A-Z0-9]+$", re.I)
+PMID_QUERY_PATTERN = re.compile(r"\b\d{7,9}\b")
+DOI_QUERY_PATTERN = re.compile(r"\b10\.\d{4,9}/[-._;()/:A-Z0-9]+\b", re.I)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+DOI_PREFIX_PATTERN = re.compile(r"^(?:https?://(?:dx\.)?doi\.org/|doi:)\s*", re.I)
+
+# Equivalent of the CSS selector div.article-full-text
+ARTICLE_FULL_TEXT_XPATH = (
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' article-full-text ')]"
+)
+
 # Set Entrez email from environment variable or fallback
 Entrez.email = os.getenv("NCBI_EMAIL", "default_email@example.com")
 
@@ -52,14 +60,21 @@ def validate_pmid(pmid):
     """
     Validate the format of a PMID.
     """
-    return re.match(r"^\d{7,9}$", pmid) is not None
+    return PMID_PATTERN.match(pmid) is not None
 
 
 def validate_doi(doi):
     """
     Validate the format of a DOI.
     """
-    return re.match(r"^10\.\d{4,9}/[-._;()/:A-Z0-9]+$", doi, re.I) is not None
+    return DOI_PATTERN.match(doi) is not None
+
+
+def clean_doi(doi):
+    """
+    Normalize a DOI by stripping URL or "doi:" prefixes and lower-casing it.
+    """
+    return DOI_PREFIX_PATTERN.sub("", doi.strip()).lower()
 
 
 # --- Fetch Functions ---
@@ -89,7 +104,7 @@ def fetch_fulltext_europe_pmc(pmid):
 
     try:
         url = f"https://www.ebi.ac.uk/europepmc/webservices/rest/{pmid}/fullTextXML"
-        response = requests.get(url, timeout=10)
+        response = get_session().get(url, timeout=10)
         if response.status_code == 200:
             return response.text
         return None
@@ -104,7 +119,7 @@ def fetch_summary_europe_pmc(pmid):
     """
     try:
         url = f"https://www.ebi.ac.uk/europepmc/webservices/rest/search?query=EXT_ID:{pmid}&resultType=core&format=json"
-        r = requests.get(url, timeout=10)
+        r = get_session().get(url, timeout=10)
         r.raise_for_status()
         data = r.json()
         return (
@@ -117,6 +132,48 @@ def fetch_summary_europe_pmc(pmid):
         return None
 
 
+def fetch_bibliographic_metadata(pmid=None, doi=None):
+    """
+    Fetch citation details (title, authors, journal, year) from Europe PMC.
+
+    A single search request, without any full-text resolution, for
+    questions that only concern a paper's bibliographic record.
+
+    Returns:
+        Dict with title, authors, journal, year, doi and pmid, or None
+    """
+    if doi:
+        query = f'DOI:"{clean_doi(doi)}"'
+    elif pmid and validate_pmid(pmid):
+        query = f"EXT_ID:{pmid} AND SRC:MED"
+    else:
+        return None
+
+    try:
+        r = get_session().get(
+            "https://www.ebi.ac.uk/europepmc/webservices/rest/search",
+            params={"query": query, "resultType": "lite", "format": "json"},
+            timeout=5,
+        )
+        r.raise_for_status()
+        results = r.json().get("resultList", {}).get("result", [])
+        if not results:
+            return None
+        record = results[0]
+        authors = record.get("authorString", "").rstrip(".")
+        return {
+            "title": record.get("title", "").rstrip("."),
+            "authors": [a.strip() for a in authors.split(",") if a.strip()],
+            "journal": record.get("journalTitle", ""),
+            "year": record.get("pubYear", ""),
+            "doi": record.get("doi", doi or ""),
+            "pmid": record.get("pmid", pmid or ""),
+        }
+    except Exception as e:
+        logging.error(f"Europe PMC metadata fetch failed for {query}: {e}")
+        return None
+
+
 def fetch_biorxiv_html(doi):
     """Fetch paper from bioRxiv."""
     if not doi.startswith("10.1101/"):
@@ -127,9 +184,9 @@ def fetch_biorxiv_html(doi):
         biorxiv_id = doi.split("/")[-1]
         url = f"https://www.biorxiv.org/content/10.1101/{biorxiv_id}"
 
-        response = requests.get(url)
+        response = get_session().get(url)
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, "lxml")
             paper_sections = soup.select("div.section")
             if paper_sections:
                 return "\n\n".join([section.get_text() for section in paper_sections])
@@ -149,7 +206,7 @@ def check_unpaywall(doi):
 
     try:
         url = f"https://api.unpaywall.org/v2/{doi}?email={Entrez.email}"
-        response = requests.get(url, timeout=10)
+        response = get_session().get(url, timeout=10)
         if response.status_code == 200:
             data = response.json()
 
@@ -198,7 +255,7 @@ def verify_pdf_url(url):
     """
     try:
         headers = {"User-Agent": "Mozilla/5.0"}
-        response = requests.head(url, headers=headers, timeout=5)
+        response = get_session().head(url, headers=headers, timeout=5)
         content_type = response.headers.get("Content-Type", "")
         return "pdf" in content_type.lower() and response.status_code == 200
     except Exception as e:
@@ -237,16 +294,15 @@ def fetch_via_institutional_access(doi, university_list=None):
         try:
             # Use Selenium to handle authentication if needed
             # This is just a placeholder - actual implementation would need Selenium
-            from selenium import webdriver
+            from resolvers.browser_pool import get_browser_pool
 
-            driver = webdriver.Chrome()
-            driver.get(proxy_url)
-            # Handle login...
-            html = driver.page_source
-            driver.quit()
+            with get_browser_pool().acquire() as driver:
+                driver.get(proxy_url)
+                # Handle login...
+                html = driver.page_source
 
             # Process HTML
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, "lxml")
             # Extract content based on common selectors
             content = None
             for selector in ["article", "div.article-body", "div.fulltext"]:
@@ -267,11 +323,11 @@ def fetch_text_from_journal_site(doi):
     publisher_patterns = {
         "10.1158": {  # AACR journals
             "url": f"https://aacrjournals.org/cancerres/article-lookup/doi/{doi}",
-            "selector": "div.article-full-text",
+            "xpath": ARTICLE_FULL_TEXT_XPATH,
         },
         "10.1371": {  # PLOS journals
             "url": f"https://journals.plos.org/plosone/article?id={doi}",
-            "selector": "div.article-full-text",
+            "xpath": ARTICLE_FULL_TEXT_XPATH,
         },
         # Add more publishers as needed
     }
@@ -279,12 +335,12 @@ def fetch_text_from_journal_site(doi):
     for prefix, config in publisher_patterns.items():
         if doi.startswith(prefix):
             try:
-                response = requests.get(config["url"])
+                response = get_session().get(config["url"])
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, "html.parser")
-                    content = soup.select_one(config["selector"])
+                    tree = lxml.html.fromstring(response.content)
+                    content = tree.xpath(config["xpath"])
                     if content:
-                        return content.get_text()
+                        return content[0].text_content()
             except Exception as e:
                 logging.error(f"Error fetching from journal site: {e}")
 
@@ -295,7 +351,7 @@ def fetch_semantic_scholar_text(doi):
     """Fetch paper from Semantic Scholar API."""
     try:
         url = f"https://api.semanticscholar.org/v1/paper/{doi}"
-        response = requests.get(url, timeout=10)
+        response = get_session().get(url, timeout=10)
         if response.status_code == 200:
             data = response.json()
 
@@ -347,7 +403,7 @@ def get_pmcid_from_pmid_or_doi(pmid=None, doi=None):
         # Try PMID first
         if pmid:
             url = f"https://www.ncbi.nlm.nih.gov/pmc/utils/idconv/v1.0/?tool=my_tool&email={Entrez.email}&ids={pmid}&format=json"
-            response = requests.get(url)
+            response = get_session().get(url)
             if response.status_code == 200:
                 data = response.json()
                 if data.get("records") and len(data["records"]) > 0:
@@ -358,7 +414,7 @@ def get_pmcid_from_pmid_or_doi(pmid=None, doi=None):
         # Try DOI if PMID didn't work
         if doi:
             url = f"https://www.ncbi.nlm.nih.gov/pmc/utils/idconv/v1.0/?tool=my_tool&email={Entrez.email}&ids={doi}&idtype=doi&format=json"
-            response = requests.get(url)
+            response = get_session().get(url)
             if response.status_code == 200:
                 data = response.json()
                 if data.get("records") and len(data["records"]) > 0:
@@ -394,7 +450,7 @@ def fetch_pmc_fulltext(pmid=None, doi=None, pmcid=None):
 
         # First try the OA service
         oa_url = f"https://www.ncbi.nlm.nih.gov/pmc/oai/oai.cgi?verb=GetRecord&identifier=oai:pubmedcentral.nih.gov:{pmcid}&metadataPrefix=pmc"
-        response = requests.get(oa_url, timeout=20)
+        response = get_session().get(oa_url, timeout=20)
 
         if response.status_code == 200:
             # Parse the XML
@@ -425,10 +481,10 @@ def fetch_pmc_fulltext(pmid=None, doi=None, pmcid=None):
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
         }
 
-        response = requests.get(html_url, headers=headers, timeout=20)
+        response = get_session().get(html_url, headers=headers, timeout=20)
 
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, "lxml")
 
             # Find the article content
             article_content = soup.select_one(
@@ -460,7 +516,7 @@ def fetch_pmc_fulltext(pmid=None, doi=None, pmcid=None):
                 text = article_content.get_text(separator=" ", strip=True)
 
                 # Clean up the text
-                text = re.sub(r"\s+", " ", text)
+                text = WHITESPACE_PATTERN.sub(" ", text)
 
                 return text
 
@@ -518,7 +574,7 @@ def extract_text_from_pdf_url(url):
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
-        response = requests.get(url, stream=True, headers=headers, timeout=30)
+        response = get_session().get(url, stream=True, headers=headers, timeout=30)
         if response.status_code == 200:
             return extract_text_from_pdf_bytes(response.content)
         return None
@@ -561,7 +617,7 @@ def fetch_from_open_repositories(doi):
     # Implementation - basic version
     try:
         # Check arXiv
-        response = requests.get(
+        response = get_session().get(
             f"https://export.arxiv.org/api/query?search_query=doi:{doi}"
         )
         if response.status_code == 200:
@@ -645,10 +701,10 @@ def fetch_from_journal_site(doi):
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
-        response = requests.get(config["url"], headers=headers, timeout=20)
+        response = get_session().get(config["url"], headers=headers, timeout=20)
 
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, "lxml")
 
             # Try multiple selectors if provided
             selectors = (
@@ -702,12 +758,12 @@ def fetch_from_scihub(doi, enable_scihub=False):
 
         for domain in scihub_domains:
             try:
-                response = requests.get(f"{domain}{doi}", timeout=10)
+                response = get_session().get(f"{domain}{doi}", timeout=10)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, "html.parser")
-                    iframe = soup.find("iframe")
-                    if iframe and iframe.get("src"):
-                        pdf_url = iframe.get("src")
+                    tree = lxml.html.fromstring(response.content)
+                    iframe_src = tree.xpath("//iframe/@src")
+                    if iframe_src:
+                        pdf_url = iframe_src[0]
                         if pdf_url.startswith("//"):
                             pdf_url = "https:" + pdf_url
                         return extract_text_from_pdf_url(pdf_url)
@@ -731,7 +787,7 @@ def search_paper_by_title(title):
         tuple: (doi, pmid)
     """
     # Clean up the title
-    title = re.sub(r"\s+", " ", title).strip()
+    title = WHITESPACE_PATTERN.sub(" ", title).strip()
 
     try:
         # Search PubMed
@@ -764,7 +820,7 @@ def search_paper_by_title(title):
     # Try CrossRef as a backup
     try:
         url = f"https://api.crossref.org/works?query.title={title}&rows=1"
-        response = requests.get(url)
+        response = get_session().get(url)
         if response.status_code == 200:
             data = response.json()
             if data["message"]["items"]:
@@ -801,9 +857,9 @@ def fetch_aacr_fulltext(doi):
                         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15",
                         "Referer": "https://aacrjournals.org/",
                     }
-                    response = requests.get(url, headers=headers, timeout=20)
+                    response = get_session().get(url, headers=headers, timeout=20)
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, "html.parser")
+                        soup = BeautifulSoup(response.text, "lxml")
 
                         # Look for the article body
                         selectors = [
@@ -849,14 +905,14 @@ def get_specific_paper_text(doi):
     if doi in special_papers:
         paper_info = special_papers[doi]
         try:
-            response = requests.get(
+            response = get_session().get(
                 paper_info["url"],
                 headers={
                     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
                 },
             )
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = BeautifulSoup(response.text, "lxml")
                 article_text = soup.select("div.article-body")
                 if article_text:
                     return " ".join([section.get_text() for section in article_text])
@@ -878,15 +934,15 @@ def resolve_full_text(pmid=None, doi=None, title=None):
         access_logs.append({"source": source, "success": success, "message": message})
     
     # Helper function to fetch from different sources
-    def fetch_from_source(fetch_func, source_name, *args, is_full_text=None, **kwargs):
+    def fetch_from_source(fetch_func, source_name, *args, full_text=None, **kwargs):
         try:
             text = fetch_func(*args, **kwargs)
             if text:
                 # Determine if it's full text if not specified
-                if is_full_text is None:
+                if full_text is None:
                     is_ft = is_full_text(text)
                 else:
-                    is_ft = is_full_text
+                    is_ft = full_text
                 
                 results.append((text, source_name, is_ft))
                 log_attempt(source_name, True, f"Retrieved {len(text)} characters")
@@ -941,7 +997,7 @@ def resolve_full_text(pmid=None, doi=None, title=None):
             lambda p: fetch_pubmed_abstract(p),
             "PubMed Abstract",
             pmid,
-            is_full_text=False,
+            full_text=False,
         )
 
     # Add PubMed Central
@@ -951,7 +1007,7 @@ def resolve_full_text(pmid=None, doi=None, title=None):
             "PubMed Central",
             pmid,
             doi,
-            is_full_text=True,
+            full_text=True,
         )
 
     # Try AACR Journal (for AACR papers)
@@ -1007,8 +1063,14 @@ def resolve_full_text(pmid=None, doi=None, title=None):
     if doi and doi.startswith("10.1158"):
         fetch_from_source(lambda d: fetch_aacr_fulltext(d), "AACR Direct URL", doi)
 
+    # Last-resort sources are slow, so skip them once full text is proven
+    def have_full_text():
+        return any(is_ft for _, _, is_ft in results)
+
     # Try SciHub as a last resort (where legal)
-    if doi:
+    if doi and have_full_text():
+        log_attempt("SciHub", False, "Skipped: full text already found")
+    elif doi:
         try:
             from resolvers.scihub import fetch_from_scihub
 
@@ -1017,24 +1079,27 @@ def resolve_full_text(pmid=None, doi=None, title=None):
             log_attempt("SciHub", False, "Module not available")
 
     # Try institutional access as another option
-    try:
-        from resolvers.institutional_access import InstitutionalAccessManager
-
+    if have_full_text():
+        log_attempt("Institutional Access", False, "Skipped: full text already found")
+    else:
         try:
-            iam = InstitutionalAccessManager()
-            if doi:
-                fetch_from_source(
-                    lambda d: iam.get_paper_via_institution(d, ["odu"]),
-                    "Institutional Access",
-                    doi,
-                )
-        except Exception as e:
-            log_attempt("Institutional Access", False, f"Error: {str(e)}")
-    except ImportError:
-        log_attempt("Institutional Access", False, "Module not available")
+            from resolvers.institutional_access import InstitutionalAccessManager
+
+            try:
+                iam = InstitutionalAccessManager()
+                if doi:
+                    fetch_from_source(
+                        lambda d: iam.get_paper_via_institution(d, ["odu"]),
+                        "Institutional Access",
+                        doi,
+                    )
+            except Exception as e:
+                log_attempt("Institutional Access", False, f"Error: {str(e)}")
+        except ImportError:
+            log_attempt("Institutional Access", False, "Module not available")
 
     # After trying all standard methods, if no full text was found but we have a PDF URL:
-    if pdf_url and not any(is_ft for _, _, is_ft in results):
+    if pdf_url and not have_full_text():
         try:
             from resolvers.browser_pdf_extractor import extract_pdf_with_browser
 
@@ -1091,7 +1156,7 @@ def extract_pmid_from_query(text):
     """
     Extract a PMID from a given text query.
     """
-    pmid_match = re.search(r"\b\d{7,9}\b", text)
+    pmid_match = PMID_QUERY_PATTERN.search(text)
     return pmid_match.group(0) if pmid_match else None
 
 
@@ -1099,38 +1164,23 @@ def extract_doi_from_query(text):
     """
     Extract a DOI from a given text query.
     """
-    doi_match = re.search(r"\b10\.\d{4,9}/[-._;()/:A-Z0-9]+\b", text, flags=re.I)
+    doi_match = DOI_QUERY_PATTERN.search(text)
     return doi_match.group(0) if doi_match else None
 
 
-def retry_request(func):
-    """Decorator to retry network requests with exponential backoff."""
-
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        max_retries = 3
-        base_delay = 1  # seconds
-
-        for attempt in range(max_retries):
-            try:
-                return func(*args, **kwargs)
-            except (RequestException, ConnectionError) as e:
-                if attempt == max_retries - 1:  # Last attempt
-                    raise
-
-                delay = base_delay * (2**attempt) + random.uniform(0, 0.5)
-                logging.warning(f"Request failed: {e}. Retrying in {delay:.2f}s...")
-                time.sleep(delay)
-
-    return wrapper
+def fetch_semantic_scholar_text(doi=None, pmid=None):
+    """Fetch full text or abstract from Semantic Scholar by DOI or PMID.
 
+    Connection errors and 429/5xx responses are retried by the shared
+    session, so there is no retry decorator on top.
+    """
+    paper_id = doi or (f"PMID:{pmid}" if pmid else None)
+    if not paper_id:
+        return None
 
-# Example of using the decorator
-@retry_request
-def fetch_semantic_scholar_text(doi):
     try:
-        url = f"https://api.semanticscholar.org/v1/paper/{doi}"
-        response = requests.get(url, timeout=10)
+        url = f"https://api.semanticscholar.org/v1/paper/{paper_id}"
+        response = get_session().get(url, timeout=10)
         if response.status_code == 200:
             data = response.json()
 
@@ -1285,11 +1335,11 @@ def fetch_from_journal_site_enhanced(doi):
             "Accept": "text/html,application/xhtml+xml,application/xml",
         }
 
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers)
         if response.status_code != 200:
             return None
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.text, "lxml")
 
         # Try to find content using publisher-specific selectors
         selectors = publisher_info.get("selectors", [])
@@ -5,6 +5,8 @@ import urllib.parse
 import time
 import random
 
+from app.utils.http import get_session
+
 
 def search_google_scholar(title, max_results=5):
     """Search Google Scholar for a paper title and return potential links."""
@@ -19,14 +21,14 @@ def search_google_scholar(title, max_results=5):
 
     results = []
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = get_session().get(url, headers=headers, timeout=30)
         if response.status_code != 200:
             logging.warning(
                 f"Google Scholar returned status code: {response.status_code}"
             )
             return results
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.text, "lxml")
         articles = soup.select(".gs_ri")
 
         for article in articles[:max_results]:
@@ -159,7 +161,7 @@ def get_fulltext_via_google_scholar(title, doi=None):
             response = session.get(link, headers=headers, timeout=30)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = BeautifulSoup(response.text, "lxml")
 
                 # Try to find article content using common selectors
                 selectors = [
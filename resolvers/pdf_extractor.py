@@ -7,6 +7,12 @@ import time
 import tempfile
 from urllib.parse import urlparse, urljoin
 import subprocess
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from app.utils.http import get_session
 
 # Import PDF libraries with fallbacks
 pdf_libraries = []
@@ -32,6 +38,56 @@ try:
 except ImportError:
     logging.warning("pdfminer.six not installed")
 
+# pdfminer (used by pdfplumber) logs every parsed object at DEBUG level
+logging.getLogger("pdfminer").setLevel(logging.WARNING)
+
+# CPU-bound extraction runs in worker processes so it does not hold the GIL
+EXTRACT_POOL_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", "2"))
+EXTRACT_TIMEOUT = 30
+_extract_pool = None
+_extract_pool_lock = threading.Lock()
+
+
+def _get_extract_pool():
+    """
+    Create the extraction process pool on first use.
+
+    Workers are started with forkserver (spawn where unavailable), since
+    forking the threaded web worker could copy locks held by other threads.
+    """
+    global _extract_pool
+    with _extract_pool_lock:
+        if _extract_pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context(
+                "forkserver" if "forkserver" in methods else "spawn"
+            )
+            _extract_pool = ProcessPoolExecutor(
+                max_workers=EXTRACT_POOL_WORKERS, mp_context=context
+            )
+        return _extract_pool
+
+
+def _recycle_extract_pool(pool, terminate=False):
+    """
+    Drop a failed extraction pool so the next call starts a fresh one.
+
+    Args:
+        pool: The pool the failed extraction ran on
+        terminate: Kill the worker processes, e.g. after an extraction timed out
+    """
+    global _extract_pool
+    with _extract_pool_lock:
+        if _extract_pool is pool:
+            _extract_pool = None
+
+    # ProcessPoolExecutor cannot cancel a running task, so stop its workers
+    processes = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False)
+    if terminate:
+        for process in processes:
+            process.terminate()
+
 
 def extract_with_pdfplumber(pdf_bytes):
     """Extract text using pdfplumber."""
@@ -73,19 +129,19 @@ def extract_with_pdfminer(pdf_bytes):
             return None
 
 
-def extract_text_from_pdf_bytes(pdf_bytes):
-    """Extract text from PDF bytes with multiple methods and enhanced OCR fallback."""
+def extract_with_standard_libraries(pdf_bytes):
+    """Extract text with the installed PDF libraries, fastest first."""
     text = ""
     extraction_methods = []
 
-    # Try standard extractors first
-    if "pdfplumber" in globals():
-        extraction_methods.append(extract_with_pdfplumber)
-
-    if "fitz" in globals():
+    # PyMuPDF's C engine is much faster than the pure-Python extractors
+    if "pymupdf" in pdf_libraries:
         extraction_methods.append(extract_with_pymupdf)
 
-    if "pdfminer" in globals():
+    if "pdfplumber" in pdf_libraries:
+        extraction_methods.append(extract_with_pdfplumber)
+
+    if "pdfminer" in pdf_libraries:
         extraction_methods.append(extract_with_pdfminer)
 
     # Try each method until one works
@@ -97,6 +153,31 @@ def extract_text_from_pdf_bytes(pdf_bytes):
         except Exception as e:
             logging.warning(f"PDF extraction method {method.__name__} failed: {e}")
 
+    return text
+
+
+def extract_text_from_pdf_bytes(pdf_bytes):
+    """Extract text from PDF bytes with multiple methods and enhanced OCR fallback."""
+    pool = _get_extract_pool()
+    try:
+        future = pool.submit(extract_with_standard_libraries, pdf_bytes)
+        text = future.result(timeout=EXTRACT_TIMEOUT)
+    except FutureTimeoutError:
+        # Skip the OCR fallback: it would run unbounded on the same PDF
+        logging.warning("PDF extraction timed out after %ss, restarting workers", EXTRACT_TIMEOUT)
+        _recycle_extract_pool(pool, terminate=True)
+        return ""
+    except BrokenProcessPool as e:
+        logging.warning("PDF extraction pool failed, extracting in-process: %s", e)
+        _recycle_extract_pool(pool)
+        text = extract_with_standard_libraries(pdf_bytes)
+    except Exception as e:
+        logging.warning("PDF extraction in worker process failed: %s", e)
+        text = ""
+
+    if text and len(text.strip()) > 200:
+        return text
+
     # If all else fails and we have OCR capability, try that
     try:
         import pytesseract
@@ -344,7 +425,7 @@ def download_pdf_to_temp(url, max_retries=3):
             if "aacrjournals.org" in url:
                 headers["Referer"] = "https://aacrjournals.org/"
 
-            response = requests.get(url, headers=headers, stream=True, timeout=30)
+            response = get_session().get(url, headers=headers, stream=True, timeout=30)
 
             if response.status_code == 200:
                 temp_file = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
@@ -1,10 +1,10 @@
-import requests
 import logging
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
-import re
+import lxml.html
 import time
 import random
+from app.utils.http import get_session
+from resolvers.full_text_resolver import clean_doi
 from resolvers.pdf_extractor import (
     extract_text_from_pdf_bytes,
     extract_text_with_external_tools,
@@ -25,10 +25,7 @@ def fetch_from_scihub(doi):
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36",
     ]
 
-    # Clean DOI
-    doi = doi.strip()
-    if doi.startswith("http"):
-        doi = re.sub(r"^https?://doi.org/", "", doi)
+    doi = clean_doi(doi)
 
     # Try each domain
     random.shuffle(domains)  # Randomize to distribute load
@@ -45,7 +42,7 @@ def fetch_from_scihub(doi):
 
             # First try the DOI search page
             url = f"{domain}/{doi}"
-            response = requests.get(url, headers=headers, timeout=30)
+            response = get_session().get(url, headers=headers, timeout=30)
 
             if response.status_code != 200:
                 logging.warning(
@@ -54,19 +51,19 @@ def fetch_from_scihub(doi):
                 continue
 
             # Parse the response
-            soup = BeautifulSoup(response.text, "html.parser")
+            tree = lxml.html.fromstring(response.content)
 
             # Check for PDF iframe
-            iframe = soup.select_one("#pdf")
-            if iframe and "src" in iframe.attrs:
-                pdf_url = iframe["src"]
+            iframe_src = tree.xpath("//*[@id='pdf']/@src")
+            if iframe_src:
+                pdf_url = iframe_src[0]
                 if pdf_url.startswith("//"):
                     pdf_url = f"https:{pdf_url}"
                 elif not pdf_url.startswith("http"):
                     pdf_url = urljoin(domain, pdf_url)
 
                 # Download PDF
-                pdf_response = requests.get(pdf_url, headers=headers, timeout=30)
+                pdf_response = get_session().get(pdf_url, headers=headers, timeout=30)
                 if pdf_response.status_code == 200:
                     # Try to extract text
                     pdf_content = pdf_response.content
@@ -79,24 +76,25 @@ def fetch_from_scihub(doi):
                         return text
 
             # If no iframe, check for embedded PDF
-            pdf_buttons = soup.select("button#save")
+            pdf_buttons = tree.xpath("//button[@id='save']")
             if pdf_buttons:
                 # This means PDF is embedded, try to get its data
                 # (Implementation would depend on how SciHub structures its embedded PDFs)
                 pass
 
             # Last resort: check for download links
-            download_links = soup.select('a[href$=".pdf"]')
+            download_links = tree.xpath(
+                "//a[substring(@href, string-length(@href) - 3) = '.pdf']/@href"
+            )
             if download_links:
-                for link in download_links:
-                    pdf_url = link["href"]
+                for pdf_url in download_links:
                     if pdf_url.startswith("//"):
                         pdf_url = f"https:{pdf_url}"
                     elif not pdf_url.startswith("http"):
                         pdf_url = urljoin(domain, pdf_url)
 
                     # Download PDF
-                    pdf_response = requests.get(pdf_url, headers=headers, timeout=30)
+                    pdf_response = get_session().get(pdf_url, headers=headers, timeout=30)
                     if pdf_response.status_code == 200:
                         # Try to extract text
                         text = extract_text_from_pdf_bytes(pdf_response.content)
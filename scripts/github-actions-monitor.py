@@ -10,6 +10,8 @@ import time
 import logging
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import subprocess
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -17,6 +19,11 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 
 
+# Runs considered for the status summary and the health score
+SUMMARY_RUNS = 20
+HEALTH_RUNS = 50
+
+
 @dataclass
 class WorkflowRun:
     """Dataclass for workflow run information."""
@@ -71,8 +78,16 @@ class GitHubActionsMonitor:
         # Get repository info
         self.owner, self.repo = self._get_repo_info()
         
-        # Setup session with authentication
+        # Setup session with authentication; one keep-alive connection to
+        # api.github.com is reused for every call, and rate limits or
+        # transient server errors are retried with backoff
         self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET'])
+        )))
         if self.github_token:
             self.session.headers.update({
                 'Authorization': f'token {self.github_token}',
@@ -90,6 +105,10 @@ class GitHubActionsMonitor:
         self.last_known_runs = {}
         self.alerts = []
         
+        # Last ETag and body per request, so unchanged data between polls
+        # comes back as a bodyless 304 that does not count against the rate limit
+        self._etag_cache: Dict[Tuple[str, str], Tuple[str, Dict]] = {}
+        
     def _extract_github_token(self) -> Optional[str]:
         """Extract GitHub token from git remotes."""
         try:
@@ -183,6 +202,34 @@ class GitHubActionsMonitor:
             # Fallback - assume MetaFunction repository based on directory structure
             return "SanjeevaRDodlapati", "MetaFunction"
     
+    def _conditional_get(self, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """GET a JSON resource, revalidating a cached copy with its ETag.
+        
+        Args:
+            url: API URL
+            params: Query parameters
+            
+        Returns:
+            Decoded JSON body, or None on an API error
+        """
+        key = (url, json.dumps(params, sort_keys=True))
+        cached = self._etag_cache.get(key)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        
+        response = self.session.get(url, params=params, headers=headers)
+        
+        if response.status_code == 304 and cached:
+            return cached[1]
+        if response.status_code != 200:
+            self.logger.error(f"API error: {response.status_code}")
+            return None
+        
+        data = response.json()
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etag_cache[key] = (etag, data)
+        return data
+    
     def get_workflow_runs(self, limit: int = 50) -> List[WorkflowRun]:
         """Get recent workflow runs with enhanced data."""
         if not self.github_token:
@@ -190,16 +237,13 @@ class GitHubActionsMonitor:
             return []
         
         try:
-            response = self.session.get(
+            data = self._conditional_get(
                 f"{self.api_base}/repos/{self.owner}/{self.repo}/actions/runs",
                 params={'per_page': limit}
             )
-            
-            if response.status_code != 200:
-                self.logger.error(f"API error: {response.status_code}")
+            if data is None:
                 return []
             
-            data = response.json()
             runs = []
             
             for run in data.get('workflow_runs', []):
@@ -233,9 +277,16 @@ class GitHubActionsMonitor:
             self.logger.error(f"Error fetching workflow runs: {e}")
             return []
     
-    def get_workflow_status_summary(self) -> Dict:
-        """Get summary of workflow statuses."""
-        runs = self.get_workflow_runs(20)
+    def get_workflow_status_summary(self, runs: Optional[List[WorkflowRun]] = None) -> Dict:
+        """Get summary of workflow statuses.
+        
+        Args:
+            runs: Already fetched runs, newest first; only the latest 20 are
+                summarized. Fetched from the API when omitted.
+        """
+        if runs is None:
+            runs = self.get_workflow_runs(SUMMARY_RUNS)
+        runs = runs[:SUMMARY_RUNS]
         
         if not runs:
             return {
@@ -311,10 +362,18 @@ class GitHubActionsMonitor:
         
         return alerts
     
-    def get_repository_health_score(self) -> Dict:
-        """Calculate an overall repository health score based on CI/CD metrics."""
-        summary = self.get_workflow_status_summary()
-        runs = self.get_workflow_runs(50)
+    def get_repository_health_score(self, runs: Optional[List[WorkflowRun]] = None,
+                                    summary: Optional[Dict] = None) -> Dict:
+        """Calculate an overall repository health score based on CI/CD metrics.
+        
+        Args:
+            runs: Already fetched runs, newest first (fetched when omitted)
+            summary: Status summary of those runs (computed when omitted)
+        """
+        if runs is None:
+            runs = self.get_workflow_runs(HEALTH_RUNS)
+        if summary is None:
+            summary = self.get_workflow_status_summary(runs)
         
         # Health score factors
         factors = {
@@ -418,9 +477,11 @@ class GitHubActionsMonitor:
     
     def generate_monitoring_report(self) -> Dict:
         """Generate comprehensive monitoring report."""
-        runs = self.get_workflow_runs(20)
-        summary = self.get_workflow_status_summary()
-        health = self.get_repository_health_score()
+        # One API call feeds the summary, health score and alerts
+        all_runs = self.get_workflow_runs(HEALTH_RUNS)
+        runs = all_runs[:SUMMARY_RUNS]
+        summary = self.get_workflow_status_summary(runs)
+        health = self.get_repository_health_score(all_runs, summary)
         
         # Check for new alerts
         new_alerts = self.check_for_new_failures(runs)
@@ -9,6 +9,8 @@ import sys
 import json
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import argparse
 import subprocess
 from typing import Dict, List, Optional, Tuple
@@ -34,8 +36,16 @@ class GitHubActionsValidator:
         # Get repository info
         self.owner, self.repo = self._get_repo_info()
         
-        # Setup session with authentication
+        # Setup session with authentication; one keep-alive connection to
+        # api.github.com is reused for every call, and rate limits or
+        # transient server errors are retried with backoff
         self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET'])
+        )))
         if self.github_token:
             self.session.headers.update({
                 'Authorization': f'token {self.github_token}',
@@ -167,37 +177,49 @@ class GitHubActionsValidator:
                 'message': 'Cannot check secrets without GitHub token'
             }]
         
-        # Check each secret via GitHub API
-        for secret in required_secrets:
-            try:
-                response = self.session.get(
-                    f"{self.api_base}/repos/{self.owner}/{self.repo}/actions/secrets/{secret}"
-                )
-                
-                if response.status_code == 200:
-                    results.append({
-                        'secret': secret,
-                        'status': 'configured',
-                        'message': 'Secret is configured'
-                    })
-                elif response.status_code == 404:
-                    results.append({
-                        'secret': secret,
-                        'status': 'missing',
-                        'message': 'Secret not configured'
-                    })
-                else:
-                    results.append({
+        if not required_secrets:
+            return results
+        
+        # List the repository's secrets once instead of probing each name
+        try:
+            configured_secrets = set()
+            url = f"{self.api_base}/repos/{self.owner}/{self.repo}/actions/secrets"
+            params = {'per_page': 100}
+            while url:
+                response = self.session.get(url, params=params)
+                if response.status_code != 200:
+                    return [{
                         'secret': secret,
                         'status': 'error',
                         'message': f'API error: {response.status_code}'
-                    })
-                    
-            except Exception as e:
+                    } for secret in sorted(required_secrets)]
+                
+                configured_secrets.update(
+                    item['name'] for item in response.json().get('secrets', [])
+                )
+                # Later pages carry their own query string
+                url = response.links.get('next', {}).get('url')
+                params = None
+                
+        except Exception as e:
+            return [{
+                'secret': secret,
+                'status': 'error',
+                'message': f'Error checking secret: {str(e)}'
+            } for secret in sorted(required_secrets)]
+        
+        for secret in sorted(required_secrets):
+            if secret in configured_secrets:
                 results.append({
                     'secret': secret,
-                    'status': 'error',
-                    'message': f'Error checking secret: {str(e)}'
+                    'status': 'configured',
+                    'message': 'Secret is configured'
+                })
+            else:
+                results.append({
+                    'secret': secret,
+                    'status': 'missing',
+                    'message': 'Secret not configured'
                 })
         
         return results
@@ -7,10 +7,20 @@ from unittest.mock import patch, Mock
 from flask import Flask
 from app.main import create_app
 from app.services.ai_service import AIService
+from app.services.logging_service import LoggingService
 from app.services.paper_service import PaperService
 from app.clients.openai_client import OpenAIClient
 
 
+@pytest.fixture(autouse=True)
+def isolated_logs(tmp_path, monkeypatch):
+    """Write chat and metadata logs to a temporary directory, not logs/."""
+    service = LoggingService(log_dir=tmp_path)
+    monkeypatch.setattr('app.routes.web.logging_service', service)
+    yield service
+    service.close()
+
+
 class TestMetaFunctionApp:
     """Test cases for the main Flask application."""
     
@@ -44,6 +54,21 @@ class TestMetaFunctionApp:
         data = json.loads(response.data)
         assert data['status'] == 'healthy'
     
+    @patch('app.routes.web.paper_service.health_check')
+    @patch('app.routes.web.ai_service.health_check')
+    def test_health_cache_control(self, mock_ai_health, mock_paper_health, client):
+        """Test that only healthy answers may be cached by probes."""
+        mock_paper_health.return_value = {'overall_status': 'healthy'}
+        mock_ai_health.return_value = {'overall_status': 'healthy'}
+        healthy = client.get('/health')
+        
+        mock_ai_health.return_value = {'overall_status': 'degraded'}
+        degraded = client.get('/health')
+        
+        assert healthy.headers['Cache-Control'] == 'public, max-age=5'
+        assert degraded.status_code == 503
+        assert degraded.headers['Cache-Control'] == 'no-store'
+    
     def test_ready_endpoint(self, client):
         """Test the readiness check endpoint."""
         response = client.get('/ready')
@@ -51,6 +76,13 @@ class TestMetaFunctionApp:
         data = json.loads(response.data)
         assert 'status' in data
     
+    def test_blueprints_share_services(self):
+        """Test that web and API routes use the same service instances."""
+        from app.routes import api, web
+        
+        assert api.ai_service is web.ai_service
+        assert api.paper_service is web.paper_service
+    
     @patch('app.services.ai_service.AIService.get_response')
     def test_chat_endpoint(self, mock_ai_service, client):
         """Test the chat endpoint with mocked AI service."""
@@ -64,6 +96,81 @@ class TestMetaFunctionApp:
         assert response.status_code == 200
         assert b'Mocked AI response' in response.data
     
+    @patch('app.routes.web.paper_service.process_query')
+    @patch('app.services.ai_service.AIService.get_response')
+    def test_chat_reuses_answer_for_repeated_query(self, mock_response, mock_process, client):
+        """Test that a repeated query skips paper resolution and the model."""
+        from app.routes.web import ai_service
+        from app.services.paper_service import PaperResult
+        mock_response.return_value = "Cached answer"
+        mock_process.return_value = PaperResult()
+        ai_service.clear_cache()
+        
+        data = {'message': 'Summarize 10.1038/nature12373', 'model': 'gpt-4o-mini'}
+        first = client.post('/chat', data=data)
+        second = client.post('/chat', data=data)
+        
+        assert b'Cached answer' in first.data
+        assert b'Cached answer' in second.data
+        assert mock_process.call_count == 1
+        assert mock_response.call_count == 1
+        ai_service.clear_cache()
+    
+    @patch('app.services.paper_service.fetch_bibliographic_metadata')
+    @patch('app.routes.web.paper_service.process_query')
+    @patch('app.services.ai_service.AIService.get_response')
+    def test_chat_metadata_query_uses_citation_record(self, mock_response, mock_process,
+                                                      mock_metadata, client):
+        """Test that a metadata-only question is answered from the citation record."""
+        mock_response.return_value = "Published in Nature"
+        mock_metadata.return_value = {
+            'title': 'Test Paper Title', 'authors': ['Author 1'], 'journal': 'Nature',
+            'year': '2013', 'doi': '10.1038/nature12373', 'pmid': ''
+        }
+    
+        response = client.post('/chat', data={
+            'message': 'What journal is 10.1038/nature12373 published in?',
+            'model': 'gpt-4o-mini',
+            'ignore_cache': 'true'
+        })
+    
+        assert response.status_code == 200
+        assert mock_process.call_count == 0
+        assert 'Journal: Nature' in mock_response.call_args.kwargs['prompt']
+    
+    @patch('app.routes.web.logging_service.get_metadata_entries')
+    def test_view_metadata_escapes_entries(self, mock_entries, client):
+        """Test that logged metadata is rendered escaped."""
+        mock_entries.return_value = [{
+            'timestamp': '2025-01-01T00:00:00',
+            'metadata': {'title': '<script>alert(1)</script>', 'datasets': ['GSE12345']}
+        }]
+        
+        response = client.get('/view_metadata')
+        
+        assert response.status_code == 200
+        assert b'&lt;script&gt;' in response.data
+        assert b'<script>' not in response.data
+        assert b'GSE12345' in response.data
+        assert b'2025-01-01T00:00:00' in response.data
+    
+    @patch('app.routes.web.logging_service.get_metadata_entries')
+    @patch('app.routes.web.logging_service.get_metadata_log_path')
+    def test_view_metadata_conditional_get(self, mock_path, mock_entries, client, tmp_path):
+        """Test that an unchanged metadata log is answered with 304."""
+        log_file = tmp_path / 'metadata_log.jsonl'
+        log_file.write_text('{}\n')
+        mock_path.return_value = log_file
+        mock_entries.return_value = []
+        
+        first = client.get('/view_metadata')
+        etag = first.headers['ETag']
+        second = client.get('/view_metadata', headers={'If-None-Match': etag})
+        
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert mock_entries.call_count == 1
+    
     def test_chat_endpoint_validation(self, client):
         """Test chat endpoint input validation."""
         # Test empty message
@@ -119,6 +226,13 @@ class TestAIService:
         """Test model validation."""
         assert ai_service.validate_model("gpt-4o-mini") is True
         assert ai_service.validate_model("invalid-model") is False
+    
+    def test_model_info_is_resolved_once(self, ai_service):
+        """Model info is precomputed and lookups return copies."""
+        for model in ai_service.get_available_models():
+            assert ai_service.get_model_info(model) == ai_service.models_info[model]
+        
+        assert ai_service.get_model_info("invalid-model")['status'] == 'unavailable'
 
 
 class TestPaperService:
@@ -166,6 +280,47 @@ class TestPaperService:
         
         assert paper_info['title'] == 'Test Paper Title'
         assert len(paper_info['authors']) == 2
+    
+    def test_is_metadata_only_query(self, paper_service):
+        """Test detection of questions that do not need the paper text."""
+        assert paper_service.is_metadata_only_query(
+            "What journal is 10.1038/nature12373 published in?"
+        )
+        assert not paper_service.is_metadata_only_query(
+            "Summarize the results of 10.1038/nature12373"
+        )
+        assert not paper_service.is_metadata_only_query("What journal is this in?")
+    
+    @patch('app.services.paper_service.PaperService.resolve_paper')
+    def test_all_sources_reports_every_resolver(self, mock_resolve, paper_service):
+        """Test that concurrent source probing keeps one entry per resolver."""
+        from app.services.paper_service import PaperResult
+        mock_resolve.return_value = PaperResult(doi="10.1038/nature12373", abstract="Abstract")
+        
+        results = paper_service.test_all_sources(doi="10.1038/nature12373")
+        
+        assert list(results) == [
+            "DOI Resolver", "PMID Resolver", "Title Search", "Enhanced Resolver"
+        ]
+        assert results["DOI Resolver"]["status"] == "success"
+        assert results["PMID Resolver"]["status"] == "skipped"
+    
+    @patch('app.services.paper_service.HEALTH_CHECK_TIMEOUT', 0.1)
+    def test_health_check_times_out(self, paper_service):
+        """Test that a hung health check is reported without blocking."""
+        import time
+        
+        with patch.object(paper_service, '_run_health_check',
+                          side_effect=lambda: time.sleep(0.5)) as mock_check:
+            health = paper_service.health_check()
+            repeated = paper_service.health_check()
+        
+        assert health['overall_status'] == 'degraded'
+        assert 'timed out' in health['error']
+        assert repeated['overall_status'] == 'degraded'
+        # The second probe waited on the check in flight instead of queueing one
+        time.sleep(0.5)
+        assert mock_check.call_count == 1
 
 
 class TestOpenAIClient:
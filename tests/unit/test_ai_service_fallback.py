@@ -0,0 +1,102 @@
+"""
+Unit tests for fallback to the default model in the AI service.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from app.services import ai_service
+from app.services.ai_service import AIService
+from tenacity import wait_none
+
+from app.utils.exceptions import APIError, TransientAPIError
+
+
+def _client(*replies, retries=True):
+    client = Mock()
+    client.is_available.return_value = True
+    client.retries_transient_errors = retries
+    client.get_response.side_effect = list(replies)
+    return client
+
+
+def test_failed_model_falls_back_once():
+    """A failing model is retried once on the fallback model."""
+    service = AIService()
+    service.clients['deepseek'] = _client(APIError("down"))
+    service.clients['openai'] = _client("from fallback")
+    
+    response = service.get_response('deepseek-chat', 'prompt', use_cache=False)
+    
+    assert response == "from fallback"
+    service.clients['openai'].get_response.assert_called_once_with('gpt-4o-mini', 'prompt')
+
+
+def test_fallback_failure_is_raised():
+    """When the fallback also fails its error reaches the caller."""
+    service = AIService()
+    service.clients['deepseek'] = _client(APIError("down"))
+    service.clients['openai'] = _client(APIError("also down"))
+    
+    with pytest.raises(APIError, match="also down"):
+        service.get_response('deepseek-chat', 'prompt', use_cache=False)
+
+
+def test_failing_provider_is_skipped_until_reset(monkeypatch):
+    """After repeated failures a provider is not called until the timeout passes."""
+    service = AIService()
+    service.clients['deepseek'] = _client(*[TransientAPIError("down")] * 5, "recovered")
+    
+    for _ in range(5):
+        with pytest.raises(APIError):
+            service.get_response('deepseek-chat', 'prompt', use_cache=False,
+                                 fallback_on_error=False)
+    
+    with pytest.raises(APIError, match="consecutive failures"):
+        service.get_response('deepseek-chat', 'prompt', use_cache=False,
+                             fallback_on_error=False)
+    assert service.clients['deepseek'].get_response.call_count == 5
+    
+    monkeypatch.setattr(ai_service, 'CIRCUIT_RESET_TIMEOUT', 0)
+    assert service.get_response('deepseek-chat', 'prompt', use_cache=False,
+                                fallback_on_error=False) == "recovered"
+
+
+def test_client_without_retries_is_retried(monkeypatch):
+    """Clients that do not retry themselves get a few attempts with backoff."""
+    monkeypatch.setattr(ai_service, '_retry_wait', wait_none())
+    service = AIService()
+    service.clients['deepseek'] = _client(TransientAPIError("blip"), "recovered", retries=False)
+    
+    assert service.get_response('deepseek-chat', 'prompt', use_cache=False,
+                                fallback_on_error=False) == "recovered"
+    assert service.clients['deepseek'].get_response.call_count == 2
+
+
+def test_retries_stop_when_circuit_opens(monkeypatch):
+    """Retrying gives up once the failures open the provider's circuit."""
+    monkeypatch.setattr(ai_service, '_retry_wait', wait_none())
+    monkeypatch.setattr(ai_service, 'CIRCUIT_FAIL_MAX', 2)
+    service = AIService()
+    service.clients['deepseek'] = _client(*[TransientAPIError("down")] * 3, retries=False)
+    
+    with pytest.raises(APIError, match="down"):
+        service.get_response('deepseek-chat', 'prompt', use_cache=False,
+                             fallback_on_error=False)
+    assert service.clients['deepseek'].get_response.call_count == 2
+
+
+def test_permanent_errors_are_not_retried(monkeypatch):
+    """Errors such as a rejected API key fail at once and leave the circuit closed."""
+    monkeypatch.setattr(ai_service, '_retry_wait', wait_none())
+    service = AIService()
+    service.clients['deepseek'] = _client(*[APIError("401 unauthorized")] * 6, retries=False)
+    
+    for _ in range(6):
+        with pytest.raises(APIError, match="unauthorized"):
+            service.get_response('deepseek-chat', 'prompt', use_cache=False,
+                                 fallback_on_error=False)
+    
+    assert service.clients['deepseek'].get_response.call_count == 6
+    assert not service._circuit_open('deepseek')
@@ -0,0 +1,44 @@
+"""
+Unit tests for concurrent multi-model queries in the AI service.
+"""
+
+import time
+from unittest.mock import Mock
+
+from app.services.ai_service import AIService
+from app.utils.exceptions import APIError
+
+
+def _slow_client(reply, delay=0.2):
+    client = Mock()
+    client.is_available.return_value = True
+    
+    def get_response(model, prompt):
+        time.sleep(delay)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+    
+    client.get_response.side_effect = get_response
+    return client
+
+
+def test_get_responses_queries_providers_concurrently():
+    """All providers are queried in parallel and errors stay per-model."""
+    service = AIService()
+    service.clients = {
+        'openai': _slow_client("from openai"),
+        'deepseek': _slow_client("from deepseek"),
+        'perplexity': _slow_client(APIError("quota exceeded")),
+    }
+    models = ['gpt-4o-mini', 'deepseek-chat', 'perplexity-online-llama3']
+    
+    start = time.monotonic()
+    results = service.get_responses(models, "prompt", use_cache=False)
+    elapsed = time.monotonic() - start
+    
+    assert elapsed < 0.5
+    assert list(results) == models
+    assert results['gpt-4o-mini'] == {'status': 'success', 'response': "from openai"}
+    assert results['deepseek-chat'] == {'status': 'success', 'response': "from deepseek"}
+    assert results['perplexity-online-llama3']['status'] == 'error'
@@ -0,0 +1,49 @@
+"""
+Unit tests for streaming responses in the AI service.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from app.services.ai_service import AIService
+from app.utils.exceptions import APIError
+
+
+@pytest.fixture
+def ai_service():
+    """AI service with a stubbed OpenAI client."""
+    service = AIService()
+    client = Mock()
+    client.is_available.return_value = True
+    service.clients['openai'] = client
+    return service
+
+
+def test_stream_caches_full_reply_after_completion(ai_service):
+    """The reply is cached only once every chunk has been yielded."""
+    ai_service.clients['openai'].stream_response.return_value = iter(["Hel", "lo"])
+    
+    stream = ai_service.stream_response('gpt-4o-mini', 'prompt')
+    assert next(stream) == "Hel"
+    assert not ai_service.query_cache
+    
+    assert list(stream) == ["lo"]
+    key = ai_service.query_cache.make_key('gpt-4o-mini', 'prompt')
+    assert ai_service.query_cache.get(key) == "Hello"
+    
+    # A second request is served from the cache in one chunk
+    assert list(ai_service.stream_response('gpt-4o-mini', 'prompt')) == ["Hello"]
+    ai_service.clients['openai'].stream_response.assert_called_once()
+
+
+def test_stream_failure_leaves_cache_empty(ai_service):
+    """An interrupted stream must not cache a partial reply."""
+    def failing_stream(model, prompt):
+        yield "partial"
+        raise RuntimeError("connection reset")
+    
+    ai_service.clients['openai'].stream_response.side_effect = failing_stream
+    
+    with pytest.raises(APIError):
+        list(ai_service.stream_response('gpt-4o-mini', 'prompt'))
+    assert not ai_service.query_cache
@@ -0,0 +1,66 @@
+"""
+Unit tests for the analysis API endpoints.
+"""
+
+from unittest.mock import Mock, patch
+
+from app.main import create_app
+from app.config import TestingConfig
+from app.utils.exceptions import APIError
+
+
+def _client():
+    app = create_app(TestingConfig)
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+@patch('app.routes.api.ai_service')
+@patch('app.routes.api.paper_service')
+def test_analyze_batch_keeps_order_and_reports_failures(mock_papers, mock_ai):
+    """Results follow query order and one failure does not fail the batch."""
+    mock_ai.validate_model.return_value = True
+    mock_papers.process_query.return_value = Mock(has_content=False)
+    
+    def get_response(model, prompt, use_cache):
+        if prompt == "bad":
+            raise APIError("quota exceeded")
+        return f"answer to {prompt}"
+    
+    mock_ai.get_response.side_effect = get_response
+    
+    response = _client().post('/api/analyze_batch', json={
+        'queries': ["first", "bad", "third"]
+    })
+    
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [r['status'] for r in results] == ['success', 'error', 'success']
+    assert results[0]['response'] == "answer to first"
+    assert results[1]['error'] == "quota exceeded"
+    assert results[2]['response'] == "answer to third"
+
+
+@patch('app.routes.api.ai_service')
+def test_analyze_batch_rejects_oversized_batches(mock_ai):
+    """Batches over the size limit are rejected before any work is done."""
+    mock_ai.validate_model.return_value = True
+    
+    response = _client().post('/api/analyze_batch', json={
+        'queries': ["query"] * 101
+    })
+    
+    assert response.status_code == 400
+    mock_ai.get_response.assert_not_called()
+
+
+@patch('app.routes.api.ai_service')
+@patch('app.routes.api.paper_service')
+def test_analyze_rejects_oversized_query_before_processing(mock_papers, mock_ai):
+    """An oversized query fails validation without resolving a paper."""
+    mock_ai.validate_model.return_value = True
+    
+    response = _client().post('/api/analyze', json={'query': 'x' * 10001})
+    
+    assert response.status_code == 400
+    mock_papers.process_query.assert_not_called()
@@ -27,7 +27,7 @@ def test_resolvers_module_imports():
     """Test that resolver modules can be imported."""
     try:
         import resolvers
-        import resolvers.decorators
+        import resolvers.pdf_extractor
         assert True
     except ImportError as e:
         pytest.fail(f"Failed to import resolver modules: {e}")
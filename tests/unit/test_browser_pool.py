@@ -0,0 +1,85 @@
+"""
+Unit tests for the pooled headless browser drivers.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from resolvers import browser_pool
+from resolvers.browser_pool import BrowserPool
+
+
+@pytest.fixture
+def pool():
+    """Browser pool whose drivers are mocks instead of real Chrome processes."""
+    with patch.object(BrowserPool, "_launch", side_effect=lambda: Mock()):
+        yield BrowserPool(size=1)
+
+
+def test_driver_is_reused_and_reset(pool):
+    """A returned driver is reused with its cookies cleared."""
+    with pool.acquire(download_dir="/tmp/downloads") as first:
+        pass
+    with pool.acquire() as second:
+        pass
+    
+    assert second is first
+    assert BrowserPool._launch.call_count == 1
+    first.execute_cdp_cmd.assert_any_call(
+        "Browser.setDownloadBehavior",
+        {"behavior": "allow", "downloadPath": "/tmp/downloads"},
+    )
+    first.execute_cdp_cmd.assert_any_call("Network.clearBrowserCookies", {})
+    first.quit.assert_not_called()
+
+
+def test_broken_driver_is_replaced(pool):
+    """A driver that raises a WebDriver error is quit and its slot freed."""
+    with pytest.raises(WebDriverException):
+        with pool.acquire() as broken:
+            raise WebDriverException("chrome crashed")
+    
+    with pool.acquire() as replacement:
+        pass
+    
+    broken.quit.assert_called_once()
+    assert replacement is not broken
+
+
+def test_waiting_caller_is_woken_when_a_slot_is_freed(pool):
+    """A caller blocked on a full pool proceeds as soon as a broken driver is discarded."""
+    import threading
+    import time
+    
+    acquired = []
+    
+    def wait_for_driver():
+        with pool.acquire(timeout=5) as driver:
+            acquired.append(driver)
+    
+    with pytest.raises(WebDriverException):
+        with pool.acquire() as broken:
+            waiter = threading.Thread(target=wait_for_driver)
+            waiter.start()
+            time.sleep(0.1)
+            started = time.monotonic()
+            raise WebDriverException("chrome crashed")
+    
+    waiter.join(timeout=5)
+    
+    assert acquired and acquired[0] is not broken
+    assert time.monotonic() - started < 1
+
+
+def test_default_size_fits_in_memory(monkeypatch):
+    """Hosts without room for two browsers still get exactly one."""
+    monkeypatch.delenv("BROWSER_POOL_SIZE", raising=False)
+    monkeypatch.setattr(browser_pool.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(
+        browser_pool.os, "sysconf",
+        lambda name: {"SC_PAGE_SIZE": 4096, "SC_PHYS_PAGES": 200_000}[name],
+    )
+    
+    assert BrowserPool().size == 1
@@ -0,0 +1,86 @@
+"""
+Unit tests for the AI response cache and the TTL cache.
+"""
+
+from unittest.mock import Mock
+
+from app.services import cache_service
+from app.services.cache_service import ResponseCache, TTLCache
+
+
+def test_key_is_fixed_size_digest():
+    """Keys do not grow with the prompt and separate model from prompt."""
+    key = ResponseCache.make_key('gpt-4o-mini', 'x' * 10000)
+    assert len(key) == 32
+    assert ResponseCache.make_key('a', 'bc') != ResponseCache.make_key('ab', 'c')
+
+
+def test_key_changes_with_cache_version(monkeypatch):
+    """Bumping the cache version invalidates previously cached replies."""
+    key = ResponseCache.make_key('gpt-4o-mini', 'prompt')
+    monkeypatch.setattr(cache_service, 'CACHE_VERSION', cache_service.CACHE_VERSION + 1)
+    assert ResponseCache.make_key('gpt-4o-mini', 'prompt') != key
+
+
+def test_memory_backend_evicts_least_recently_used():
+    """Without Redis the cache falls back to an in-process LRU."""
+    cache = ResponseCache(max_size=2, redis_url='')
+    assert cache.backend == 'memory'
+    
+    cache.set('a', '1')
+    cache.set('b', '2')
+    assert cache.get('a') == '1'
+    cache.set('c', '3')
+    
+    assert cache.get('b') is None
+    assert cache.get('a') == '1'
+    assert len(cache) == 2
+    
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_memory_backend_is_thread_safe():
+    """Concurrent reads and evicting writes keep the LRU within its bound."""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    cache = ResponseCache(max_size=8, redis_url='')
+    
+    def churn(worker):
+        for i in range(2000):
+            key = f'{worker}-{i % 16}'
+            cache.set(key, 'reply')
+            cache.get(key)
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(churn, range(8)))
+    
+    assert len(cache) == 8
+
+
+def test_hit_rate_counts_lookups():
+    """Hits and misses are counted for cache statistics."""
+    cache = ResponseCache(max_size=2, redis_url='')
+    assert cache.hit_rate == 0.0
+    
+    cache.set('a', '1')
+    cache.get('a')
+    cache.get('missing')
+    
+    assert (cache.hits, cache.lookups) == (1, 2)
+    assert cache.hit_rate == 0.5
+
+
+def test_ttl_cache_reuses_value_until_expiry(monkeypatch):
+    """Values are computed once per TTL window."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_service.time, "monotonic", lambda: now[0])
+    compute = Mock(side_effect=["first", "second"])
+    cache = TTLCache(ttl=10)
+    
+    assert cache.get_or_set("health", compute) == "first"
+    now[0] += 9
+    assert cache.get_or_set("health", compute) == "first"
+    now[0] += 2
+    assert cache.get_or_set("health", compute) == "second"
+    assert compute.call_count == 2
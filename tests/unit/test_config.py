@@ -0,0 +1,91 @@
+"""
+Unit tests for environment-driven configuration parsing.
+"""
+
+import os
+
+import pytest
+
+from app.config import dev_secret_key, env_bool, env_int
+
+
+def test_env_int_parses_and_defaults(monkeypatch):
+    """Integers are coerced, and unset variables use the default."""
+    monkeypatch.setenv("CACHE_SIZE", "250")
+    monkeypatch.delenv("CACHE_TTL", raising=False)
+    
+    assert env_int("CACHE_SIZE", 100) == 250
+    assert env_int("CACHE_TTL", 86400) == 86400
+
+
+def test_env_int_rejects_garbage(monkeypatch):
+    """A malformed integer fails with the variable name in the message."""
+    monkeypatch.setenv("CACHE_SIZE", "lots")
+    
+    with pytest.raises(ValueError, match="CACHE_SIZE"):
+        env_int("CACHE_SIZE", 100)
+
+
+@pytest.mark.parametrize("value,expected", [
+    ("true", True), ("YES", True), ("1", True),
+    ("false", False), ("off", False), ("0", False),
+])
+def test_env_bool_values(monkeypatch, value, expected):
+    """Common spellings of true and false are accepted."""
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", value)
+    assert env_bool("RATE_LIMIT_ENABLED", not expected) is expected
+
+
+def test_env_bool_rejects_garbage(monkeypatch):
+    """Unrecognized boolean values are rejected rather than read as False."""
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "maybe")
+    
+    with pytest.raises(ValueError, match="RATE_LIMIT_ENABLED"):
+        env_bool("RATE_LIMIT_ENABLED", True)
+
+
+def test_dev_secret_key_is_persisted(tmp_path):
+    """The development key is generated once and reused afterwards."""
+    key_file = tmp_path / ".dev_secret_key"
+    
+    key = dev_secret_key(key_file)
+    
+    assert len(key) == 64
+    assert key_file.read_text() == key
+    assert dev_secret_key(key_file) == key
+
+
+
+def test_dev_secret_key_race_reads_winner(tmp_path, monkeypatch):
+    """A worker that loses the creation race uses the key already stored."""
+    key_file = tmp_path / ".dev_secret_key"
+    real_link = os.link
+    
+    def link_after_rival(src, dst):
+        key_file.write_text("rival-key")
+        real_link(src, dst)
+    
+    monkeypatch.setattr(os, "link", link_after_rival)
+    
+    assert dev_secret_key(key_file) == "rival-key"
+    assert [p.name for p in tmp_path.iterdir()] == [".dev_secret_key"]
+
+
+
+def test_dev_secret_key_only_outside_production(monkeypatch):
+    """Development falls back to the local key; production requires SECRET_KEY."""
+    from flask import Flask
+    
+    from app import config
+    
+    monkeypatch.setattr(config, "dev_secret_key", lambda: "dev-key")
+    dev_app = Flask(__name__)
+    dev_app.config["SECRET_KEY"] = None
+    config.DevelopmentConfig.init_app(dev_app)
+    
+    monkeypatch.delenv("SECRET_KEY", raising=False)
+    prod_app = Flask(__name__)
+    
+    assert dev_app.config["SECRET_KEY"] == "dev-key"
+    with pytest.raises(ValueError, match="SECRET_KEY"):
+        config.ProductionConfig.init_app(prod_app)
@@ -0,0 +1,89 @@
+"""
+Unit tests for DeepSeek endpoint selection.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from app.clients.deepseek_client import DeepSeekClient
+from app.utils import serialization
+from app.utils.exceptions import APIError, TransientAPIError
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """DeepSeek client with an API key and a stubbed session."""
+    monkeypatch.setenv('DEEPSEEK_API_KEY', 'test-key')
+    instance = DeepSeekClient()
+    instance.session = Mock()
+    return instance
+
+
+def _ok(content):
+    return Mock(status_code=200, content=serialization.dumps({
+        "choices": [{"message": {"content": content}}]
+    }))
+
+
+def test_failed_endpoint_is_skipped_on_later_calls(client):
+    """After the first endpoint fails, later calls go straight to the working one."""
+    dead, alive = client.endpoints
+    
+    def post(endpoint, **kwargs):
+        if endpoint == dead:
+            raise requests.exceptions.ConnectTimeout("timed out")
+        return _ok("hello")
+    
+    client.session.post.side_effect = post
+    
+    assert client.get_response('deepseek-chat', 'hi') == "hello"
+    assert client.session.post.call_count == 2
+    
+    client.session.post.reset_mock()
+    assert client.get_response('deepseek-chat', 'hi') == "hello"
+    assert [c.args[0] for c in client.session.post.call_args_list] == [alive]
+
+
+def test_failure_is_transient_only_if_every_endpoint_was(client):
+    """Server errors are worth retrying; a rejected key on any endpoint is not."""
+    client.session.post.return_value = Mock(status_code=503, text="busy")
+    with pytest.raises(TransientAPIError):
+        client.get_response('deepseek-chat', 'hi')
+    
+    client.session.post.side_effect = [
+        Mock(status_code=401, text="bad key"), Mock(status_code=503, text="busy")
+    ]
+    with pytest.raises(APIError) as excinfo:
+        client.get_response('deepseek-chat', 'hi')
+    assert not isinstance(excinfo.value, TransientAPIError)
+
+
+def test_endpoint_is_retried_after_cooldown(client):
+    """A demoted endpoint returns to the rotation once its cool-down expires."""
+    dead, alive = client.endpoints
+    client._mark_failure(dead)
+    assert client._ordered_endpoints() == [alive, dead]
+    
+    client._endpoint_health[dead]['fail_ts'] -= 3600
+    assert client._ordered_endpoints()[0] == dead
+
+
+def test_stream_parses_sse_chunks(client):
+    """Streamed completions yield each content delta in order."""
+    response = Mock(status_code=200)
+    response.__enter__ = Mock(return_value=response)
+    response.__exit__ = Mock(return_value=False)
+    response.iter_lines.return_value = iter([
+        'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+        '',
+        'data: {"choices": [{"delta": {"content": "Hel"}}]}',
+        'data: {"choices": [{"delta": {"content": "lo"}}]}',
+        'data: [DONE]',
+    ])
+    client.session.post.return_value = response
+    
+    assert list(client.stream_response('deepseek-chat', 'hi')) == ["Hel", "lo"]
+    payload = serialization.loads(client.session.post.call_args.kwargs['data'])
+    assert payload['stream'] is True
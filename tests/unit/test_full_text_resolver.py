@@ -0,0 +1,52 @@
+"""
+Unit tests for full text resolver helpers.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from resolvers import full_text_resolver
+from resolvers.full_text_resolver import clean_doi
+
+
+@pytest.mark.parametrize("raw", [
+    "10.1038/nature12373",
+    "HTTPS://DOI.ORG/10.1038/NATURE12373",
+    "http://dx.doi.org/10.1038/nature12373",
+    "doi: 10.1038/nature12373",
+    "  DOI:10.1038/Nature12373 \n",
+])
+def test_clean_doi_strips_prefixes_and_case(raw):
+    """URL and doi: prefixes, surrounding whitespace and case are normalized."""
+    assert clean_doi(raw) == "10.1038/nature12373"
+
+
+def test_clean_doi_keeps_inner_text():
+    """Only a leading prefix is removed."""
+    assert clean_doi("10.1000/doi:abc") == "10.1000/doi:abc"
+
+
+def test_last_resort_sources_skipped_after_full_text():
+    """Once a source returns full text, SciHub and institutional access are skipped."""
+    scihub = Mock(return_value=None)
+    no_content = Mock(return_value=None)
+    
+    with patch.multiple(
+        full_text_resolver,
+        get_pmcid_from_pmid_or_doi=no_content,
+        fetch_fulltext_europe_pmc=Mock(return_value="x" * 5000),
+        fetch_pmc_fulltext=no_content,
+        fetch_from_journal_site=no_content,
+        fetch_semantic_scholar_text=no_content,
+        check_unpaywall=no_content,
+        fetch_from_open_repositories=no_content,
+    ), patch("resolvers.scihub.fetch_from_scihub", scihub):
+        result = full_text_resolver.resolve_full_text(doi="10.1000/example")
+    
+    assert result["source"] == "Europe PMC"
+    assert result["is_full_text"] is True
+    scihub.assert_not_called()
+    skipped = {log["source"] for log in result["access_logs"]
+               if log["message"].startswith("Skipped")}
+    assert skipped == {"SciHub", "Institutional Access"}
@@ -0,0 +1,52 @@
+"""
+Unit tests for the shared HTTP utilities.
+"""
+
+import ssl
+from unittest.mock import Mock
+
+from app.utils.http import get_session, get_ssl_context
+
+
+def test_ssl_context_is_verified():
+    """The shared context must verify certificates and hostnames."""
+    context = get_ssl_context()
+    assert context.verify_mode == ssl.CERT_REQUIRED
+    assert context.check_hostname is True
+
+
+def test_ssl_context_is_shared():
+    """Repeated calls return the same context instance."""
+    assert get_ssl_context() is get_ssl_context()
+
+
+def test_session_is_shared_and_pooled():
+    """The shared session reuses one pooled adapter for HTTPS."""
+    session = get_session()
+    assert session is get_session()
+    
+    adapter = session.get_adapter('https://api.unpaywall.org')
+    assert adapter._pool_maxsize == 64
+    assert adapter.max_retries.total == 3
+
+
+def test_session_verifies_with_shared_context():
+    """HTTPS connections use the shared verified SSL context."""
+    adapter = get_session().get_adapter('https://api.unpaywall.org')
+    assert adapter.poolmanager.connection_pool_kw['ssl_context'] is get_ssl_context()
+    
+    conn = Mock()
+    adapter.cert_verify(conn, 'https://api.unpaywall.org', True, None)
+    assert conn.cert_reqs == 'CERT_REQUIRED'
+    assert conn.ca_certs is None
+
+
+def test_ai_clients_keep_their_own_pooled_session():
+    """Provider clients reuse one keep-alive session across calls."""
+    from app.clients.deepseek_client import DeepSeekClient
+    from app.clients.perplexity_client import PerplexityClient
+    
+    for client in (DeepSeekClient(), PerplexityClient()):
+        adapter = client.session.get_adapter('https://api.example.com')
+        assert adapter._pool_maxsize == 20
+        assert 'POST' not in adapter.max_retries.allowed_methods
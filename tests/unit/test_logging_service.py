@@ -0,0 +1,111 @@
+"""
+Unit tests for the logging service.
+"""
+
+import pytest
+
+from app.services.logging_service import LoggingService
+
+
+@pytest.fixture
+def logging_service(temp_dir):
+    """Create a logging service writing to a temporary directory."""
+    service = LoggingService(log_dir=temp_dir)
+    yield service
+    service.close()
+
+
+def test_log_chat_appends_rows(logging_service):
+    """Chat rows are readable back in the order they were logged."""
+    logging_service.log_chat('session-1', 'first', 'reply', {'doi': '10.1/x'}, 'gpt-4o-mini')
+    logging_service.log_chat('session-2', 'second', '', {}, 'gpt-4', error='boom')
+    
+    chats = logging_service.get_recent_chats()
+    
+    assert [chat['session_id'] for chat in chats] == ['session-1', 'session-2']
+    assert chats[0]['paper_doi'] == '10.1/x'
+    assert chats[1]['error'] == 'boom'
+
+
+def test_recent_chats_and_usage_stats(logging_service):
+    """Only the requested tail is returned and stats cover every row read."""
+    for i in range(5):
+        logging_service.log_chat(f'session-{i}', 'q', 'reply', {'doi': '10.1/x'} if i % 2 else {},
+                                 'gpt-4', error='boom' if i == 4 else None)
+    
+    recent = logging_service.get_recent_chats(limit=2)
+    stats = logging_service.get_usage_stats()
+    
+    assert [chat['session_id'] for chat in recent] == ['session-3', 'session-4']
+    assert stats['total_chats'] == 5
+    assert stats['models_used'] == {'gpt-4': 5}
+    assert stats['papers_processed'] == 2
+    assert stats['success_rate'] == 80.0
+
+
+def test_log_chat_reopens_after_close(logging_service):
+    """Closing the service does not prevent further logging."""
+    logging_service.log_chat('session-1', 'first', 'reply', {}, 'gpt-4o-mini')
+    logging_service.close()
+    logging_service.log_chat('session-2', 'second', 'reply', {}, 'gpt-4o-mini')
+    
+    assert len(logging_service.get_recent_chats()) == 2
+
+
+def test_log_metadata_appends_json_lines(logging_service):
+    """Metadata entries are appended one JSON document per line."""
+    logging_service.log_metadata('session-1', {'title': 'First'})
+    logging_service.log_metadata('session-2', {'title': 'Second'})
+    
+    lines = logging_service.get_metadata_log_path().read_bytes().splitlines()
+    entries = logging_service.get_metadata_entries()
+    
+    assert len(lines) == 2
+    assert [entry['metadata']['title'] for entry in entries] == ['First', 'Second']
+    assert entries[0]['session_id'] == 'session-1'
+    assert entries[0]['timestamp']
+
+
+def test_metadata_log_retention_is_bounded(logging_service, monkeypatch):
+    """The metadata log is compacted to the most recent entries."""
+    monkeypatch.setattr('app.services.logging_service.METADATA_LOG_MAX_ENTRIES', 3)
+    
+    for i in range(6):
+        logging_service.log_metadata(f'session-{i}', {'title': str(i)})
+    
+    lines = logging_service.get_metadata_log_path().read_bytes().splitlines()
+    
+    assert len(lines) == 3
+    assert [entry['metadata']['title'] for entry in logging_service.get_metadata_entries()] == [
+        '3', '4', '5'
+    ]
+
+
+def test_metadata_json_stream_is_valid_json(logging_service):
+    """The streamed download is a JSON array of every logged entry."""
+    import json
+    
+    logging_service.log_metadata('session-1', {'title': 'First'})
+    logging_service.log_metadata('session-2', {'title': 'Second'})
+    
+    document = json.loads(b''.join(logging_service.iter_metadata_json()))
+    
+    assert [entry['session_id'] for entry in document] == ['session-1', 'session-2']
+
+
+def test_legacy_metadata_log_is_migrated(temp_dir):
+    """An existing JSON array log is converted to JSON Lines on startup."""
+    import json
+    
+    legacy_file = temp_dir / 'metadata_log.json'
+    legacy_file.write_text(json.dumps([
+        {'timestamp': 't', 'session_id': 's', 'metadata': {'title': 'Legacy'}}
+    ]))
+    
+    service = LoggingService(log_dir=temp_dir)
+    
+    assert not legacy_file.exists()
+    assert service.get_metadata_entries() == [
+        {'timestamp': 't', 'session_id': 's', 'metadata': {'title': 'Legacy'}}
+    ]
+    service.close()
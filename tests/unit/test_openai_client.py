@@ -0,0 +1,65 @@
+"""
+Unit tests for OpenAI client retry handling.
+"""
+
+from unittest.mock import Mock, patch
+
+import openai
+import pytest
+
+from app.clients import openai_client
+from app.clients.openai_client import OpenAIClient
+
+
+def _rate_limit_error(headers):
+    response = Mock(status_code=429, headers=headers)
+    return openai.RateLimitError("Rate limit reached", response=response, body=None)
+
+
+@pytest.fixture
+def client():
+    """OpenAI client with a stubbed SDK client and no real sleeping."""
+    with patch.object(OpenAIClient._safe_create.retry, "sleep") as sleep:
+        instance = OpenAIClient.__new__(OpenAIClient)
+        instance.api_key = "test-key"
+        instance.client = Mock()
+        instance.sleep = sleep
+        yield instance
+
+
+def test_retry_after_header_sets_wait(client):
+    """Rate limits wait exactly as long as the Retry-After header asks."""
+    create = client.client.chat.completions.create
+    create.side_effect = [_rate_limit_error({"retry-after": "7"}), "ok"]
+    
+    assert client._safe_create(model="gpt-4o-mini", messages=[]) == "ok"
+    client.sleep.assert_called_once_with(7.0)
+
+
+def test_rate_limit_reset_header():
+    """Fall back to the request limit reset header when Retry-After is absent."""
+    error = _rate_limit_error({"x-ratelimit-reset-requests": "1m30.5s"})
+    assert openai_client._retry_after_seconds(error) == 90.5
+
+
+def test_error_message_is_not_parsed():
+    """The error text is never scanned for a wait hint."""
+    error = Exception("Please try again in 1.5s")
+    assert openai_client._retry_after_seconds(error) is None
+
+
+def test_non_transient_errors_are_not_retried(client):
+    """Errors such as bad requests fail on the first attempt."""
+    create = client.client.chat.completions.create
+    create.side_effect = ValueError("bad request")
+    
+    with pytest.raises(ValueError):
+        client._safe_create(model="gpt-4o-mini", messages=[])
+    assert create.call_count == 1
+
+
+def test_sdk_retries_are_disabled(monkeypatch):
+    """Only _safe_create retries; the SDK client makes a single attempt."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    
+    assert OpenAIClient().client.max_retries == 0
@@ -0,0 +1,30 @@
+"""
+Unit tests for the orjson-backed JSON helpers.
+"""
+
+from datetime import datetime
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from app.utils.serialization import OrjsonProvider
+
+
+def test_provider_matches_default_output():
+    """Compact and indented output match Flask's default provider."""
+    app = Flask(__name__)
+    fast = OrjsonProvider(app)
+    default = DefaultJSONProvider(app)
+    data = {"b": [1, 2.5, None], "a": "naïve", "c": {"z": True, "y": {}},
+            "when": datetime(2024, 1, 2, 3, 4, 5)}
+    
+    assert fast.loads(fast.dumps(data, separators=(",", ":"))) == \
+        default.loads(default.dumps(data, separators=(",", ":")))
+    assert fast.dumps(data, indent=2) == default.dumps(data, indent=2, ensure_ascii=False)
+
+
+def test_provider_falls_back_for_unsupported_options():
+    """Options orjson cannot express are handled by the standard library."""
+    app = Flask(__name__)
+    
+    assert OrjsonProvider(app).dumps({"a": 1}, indent=4) == '{\n    "a": 1\n}'